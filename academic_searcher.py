@@ -3,47 +3,195 @@ ACADEMIC SEARCHER PRO - Akademik Makalelerin Google'ı
 Gelişmiş Arama + Not Modülü + Özet Çıkarma
 """
 
+import sys
+import argparse
 import threading
+import queue
+import bisect
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import multiprocessing
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import (ConnectTimeoutError, MaxRetryError, NewConnectionError, ReadTimeoutError,
+                                ResponseError)
+from urllib.parse import urlsplit, urljoin
+import importlib.util
+import functools
+import hashlib
+import heapq
+import operator
+import types
+import weakref
+from collections import OrderedDict, deque
 import json
 import time
 import re
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+import unicodedata
 from datetime import datetime
 import sqlite3
 import os
-import nltk
-from sumy.parsers.plaintext import PlaintextParser
-from sumy.nlp.tokenizers import Tokenizer
-from sumy.summarizers.lsa import LsaSummarizer
-from sumy.summarizers.text_rank import TextRankSummarizer
 
-# Ttkbootstrap teması (opsiyonel)
+# Tkinter (opsiyonel - komut satırı modu onsuz çalışır)
 try:
-    import ttkbootstrap as tb
-    THEME_AVAILABLE = True
+    import tkinter as tk
+    from tkinter import ttk, messagebox, scrolledtext, filedialog
+    GUI_AVAILABLE = True
 except ImportError:
-    THEME_AVAILABLE = False
+    GUI_AVAILABLE = False
 
-# NLTK verilerini indir
+# Özetleme kütüphaneleri (opsiyonel - ilk kullanımda yüklenir, bkz. load_summary_stack)
+SUMMARY_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('nltk', 'sumy'))
+
+# Ttkbootstrap teması (opsiyonel - yalnızca arayüz açılırken yüklenir)
+THEME_AVAILABLE = importlib.util.find_spec('ttkbootstrap') is not None
+
+# Hızlı JSON çözücü (opsiyonel - yoksa standart json modülü kullanılır)
 try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(data):
+    """bytes/str JSON çöz; orjson kuruluysa onu kullan"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+_summary_stack = None
+_summary_stack_lock = threading.Lock()
+
+
+def load_summary_stack():
+    """nltk ve sumy'yi ilk kullanımda yükle; punkt verisi yoksa indir
+    
+    Açılışı yavaşlatmamak için modül yüklenirken çağrılmaz. Birden çok
+    thread aynı anda çağırabilir, yükleme yalnızca bir kez yapılır.
+    """
+    global _summary_stack
+    with _summary_stack_lock:
+        if _summary_stack is None:
+            import nltk
+            from sumy.parsers.plaintext import PlaintextParser
+            from sumy.nlp.tokenizers import Tokenizer
+            from sumy.summarizers.lsa import LsaSummarizer
+            from sumy.summarizers.text_rank import TextRankSummarizer
+            
+            # NLTK verilerini indir
+            try:
+                nltk.data.find('tokenizers/punkt')
+            except LookupError:
+                nltk.download('punkt')
+            
+            _summary_stack = types.SimpleNamespace(
+                nltk=nltk,
+                PlaintextParser=PlaintextParser,
+                Tokenizer=Tokenizer,
+                LsaSummarizer=LsaSummarizer,
+                TextRankSummarizer=TextRankSummarizer
+            )
+        return _summary_stack
+
+class _ThreadConnection:
+    """Bir thread'in bağlantısı; thread bitip threading.local verisi silinince kapanır"""
+    
+    __slots__ = ('conn', '__weakref__')
+    
+    def __init__(self, conn):
+        self.conn = conn
+    
+    def __del__(self):
+        self.conn.close()
+
+
+class ConnectionManager:
+    """Thread başına kalıcı SQLite bağlantısı (WAL modu, ayarlı PRAGMA'lar)
+    
+    Her thread kendi bağlantısını tekrar kullanır; sqlite3'ün ifade önbelleği
+    (cached_statements) sayesinde aynı SQL metinleri hazırlanmış olarak kalır.
+    Bağlantı yalnızca thread'in yerel verisinde tutulur: kısa ömürlü worker
+    thread'ler (arama havuzu, özet işleri) bitince bağlantıları da kapanır.
+    """
+    
+    PRAGMAS = (
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA cache_size=-16000',    # ~16 MB sayfa önbelleği
+        'PRAGMA mmap_size=268435456',  # 256 MB bellek eşlemesi
+        'PRAGMA temp_store=MEMORY'
+    )
+    
+    def __init__(self, db_path, busy_timeout=10.0, cached_statements=256):
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._open = weakref.WeakSet()  # close() için; thread'lerin bağlantılarını canlı tutmaz
+        self._lock = threading.Lock()
+    
+    def get(self):
+        """Bu thread'in bağlantısını getir (yoksa aç)"""
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            # check_same_thread=False: bağlantı, thread bittikten sonra başka
+            # bir thread'de (ya da close() ile) kapatılabilsin; paylaşılmaz
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout,
+                                   cached_statements=self.cached_statements,
+                                   check_same_thread=False)
+            for pragma in self.PRAGMAS:
+                conn.execute(pragma)
+            holder = _ThreadConnection(conn)
+            self._local.holder = holder
+            with self._lock:
+                self._open.add(holder)
+        return holder.conn
+    
+    @property
+    def open_connections(self):
+        """Açık bağlantı sayısı"""
+        with self._lock:
+            return len(self._open)
+    
+    def close(self):
+        """Tüm thread'lerin bağlantılarını kapat"""
+        with self._lock:
+            for holder in list(self._open):
+                holder.conn.close()
+            self._open.clear()
+        self._local = threading.local()
+
 
 class DatabaseManager:
     """Veritabanı yönetim sınıfı"""
     
+    # FTS5 sütun ağırlıkları (bm25): title, content, tags, source_title, source_authors
+    FTS_WEIGHTS = (10.0, 1.0, 5.0, 3.0, 3.0)
+    
+    SUMMARY_CACHE_MAX_ROWS = 2000  # Kalıcı özet önbelleği; en eski kayıtlar silinir
+    
     def __init__(self, db_path="academic_notes.db"):
         self.db_path = db_path
+        self.connections = ConnectionManager(db_path)
+        self.fts_available = False
         self.init_database()
     
+    def transaction(self):
+        """Yazma işlemlerini tek işlemde toplamak için bağlam yöneticisi
+        
+        Kullanım: with db.transaction() as conn: ...
+        """
+        return self.connections.get()
+    
+    def close(self):
+        """Veritabanı bağlantılarını kapat"""
+        self.connections.close()
+    
     def init_database(self):
         """Veritabanını başlat"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.connections.get() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS notes (
@@ -60,11 +208,75 @@ class DatabaseManager:
                     modified_date TEXT
                 )
             ''')
+            # Eski veritabanları: toplu özet sütununu ekle
+            cursor.execute('PRAGMA table_info(notes)')
+            if 'summary' not in [column[1] for column in cursor.fetchall()]:
+                cursor.execute('ALTER TABLE notes ADD COLUMN summary TEXT')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_notes_modified
+                ON notes(modified_date DESC, id DESC)
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS summary_cache (
+                    content_hash TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_date TEXT,
+                    PRIMARY KEY (content_hash, kind)
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_summary_cache_created ON summary_cache(created_date)')
+            self.fts_available = self._init_fts(cursor)
             conn.commit()
     
+    def _init_fts(self, cursor):
+        """FTS5 tam metin indeksini ve senkronizasyon tetikleyicilerini kur"""
+        try:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='notes_fts'")
+            needs_rebuild = cursor.fetchone() is None
+            
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+                    title, content, tags, source_title, source_authors,
+                    content='notes', content_rowid='id', tokenize='unicode61'
+                )
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS notes_fts_insert AFTER INSERT ON notes BEGIN
+                    INSERT INTO notes_fts(rowid, title, content, tags, source_title, source_authors)
+                    VALUES (new.id, new.title, new.content, new.tags, new.source_title, new.source_authors);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS notes_fts_delete AFTER DELETE ON notes BEGIN
+                    INSERT INTO notes_fts(notes_fts, rowid, title, content, tags, source_title, source_authors)
+                    VALUES ('delete', old.id, old.title, old.content, old.tags, old.source_title, old.source_authors);
+                END
+            ''')
+            # Yalnızca indekslenen sütunlar değişince çalışır (summary güncellemeleri indeksi yormaz)
+            cursor.execute('DROP TRIGGER IF EXISTS notes_fts_update')
+            cursor.execute('''
+                CREATE TRIGGER notes_fts_update
+                AFTER UPDATE OF title, content, tags, source_title, source_authors ON notes BEGIN
+                    INSERT INTO notes_fts(notes_fts, rowid, title, content, tags, source_title, source_authors)
+                    VALUES ('delete', old.id, old.title, old.content, old.tags, old.source_title, old.source_authors);
+                    INSERT INTO notes_fts(rowid, title, content, tags, source_title, source_authors)
+                    VALUES (new.id, new.title, new.content, new.tags, new.source_title, new.source_authors);
+                END
+            ''')
+            
+            # Eski veritabanları: mevcut notları indekse aktar
+            if needs_rebuild:
+                cursor.execute("INSERT INTO notes_fts(notes_fts) VALUES('rebuild')")
+            return True
+        except sqlite3.OperationalError:
+            # SQLite FTS5 desteği olmadan derlenmiş
+            return False
+    
     def add_note(self, note_data):
         """Yeni not ekle"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.connections.get() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT INTO notes 
@@ -85,33 +297,128 @@ class DatabaseManager:
             ))
             return cursor.lastrowid
     
+    def add_notes(self, notes):
+        """Birden çok notu tek işlemde ekle"""
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.transaction() as conn:
+            conn.executemany('''
+                INSERT INTO notes 
+                (title, content, source_title, source_url, source_authors, source_year, 
+                 page_reference, tags, created_date, modified_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [(
+                note_data['title'],
+                note_data['content'],
+                note_data.get('source_title', ''),
+                note_data.get('source_url', ''),
+                note_data.get('source_authors', ''),
+                note_data.get('source_year', ''),
+                note_data.get('page_reference', ''),
+                note_data.get('tags', ''),
+                now,
+                now
+            ) for note_data in notes])
+    
     def get_all_notes(self):
         """Tüm notları getir"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.connections.get() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT * FROM notes ORDER BY modified_date DESC')
+            cursor.execute('SELECT * FROM notes ORDER BY modified_date DESC, id DESC')
             return [self._row_to_dict(row) for row in cursor.fetchall()]
     
-    def search_notes(self, query):
-        """Notlarda arama yap"""
-        with sqlite3.connect(self.db_path) as conn:
+    def get_note(self, note_id):
+        """Tek notu birincil anahtarla getir (yoksa None)"""
+        with self.connections.get() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM notes WHERE id=?', (note_id,))
+            row = cursor.fetchone()
+            return self._row_to_dict(row) if row else None
+    
+    def get_notes_page(self, limit=100, cursor_key=None):
+        """Notları sayfa sayfa getir (modified_date, id üzerinde keyset sayfalama)
+        
+        Dönüş: (notlar, sonraki_sayfa_anahtarı). Son sayfada anahtar None olur.
+        """
+        with self.connections.get() as conn:
+            cursor = conn.cursor()
+            if cursor_key is None:
+                cursor.execute('''
+                    SELECT * FROM notes ORDER BY modified_date DESC, id DESC LIMIT ?
+                ''', (limit,))
+            else:
+                cursor.execute('''
+                    SELECT * FROM notes WHERE (modified_date, id) < (?, ?)
+                    ORDER BY modified_date DESC, id DESC LIMIT ?
+                ''', (cursor_key[0], cursor_key[1], limit))
+            notes = [self._row_to_dict(row) for row in cursor.fetchall()]
+        
+        next_key = (notes[-1]['modified_date'], notes[-1]['id']) if len(notes) == limit else None
+        return notes, next_key
+    
+    def search_notes(self, query, limit=200, offset=0):
+        """Notlarda arama yap (FTS5 + BM25 sıralama, yoksa LIKE)
+        
+        Kelimeler VE ile birleşir; "tırnaklı ifade" öbek, kelime* önek araması yapar.
+        Sonuçlar offset'ten itibaren en fazla limit kadardır (limit=-1: tümü).
+        """
+        fts_query = self._build_fts_query(query)
+        if not self.fts_available or not fts_query:
+            return self._search_notes_like(query, limit, offset)
+        
+        try:
+            with self.connections.get() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT notes.*, snippet(notes_fts, -1, '[', ']', '…', 12)
+                    FROM notes_fts JOIN notes ON notes.id = notes_fts.rowid
+                    WHERE notes_fts MATCH ?
+                    ORDER BY bm25(notes_fts, ?, ?, ?, ?, ?), notes.id
+                    LIMIT ? OFFSET ?
+                ''', (fts_query,) + self.FTS_WEIGHTS + (limit, offset))
+                notes = []
+                for row in cursor.fetchall():
+                    note = self._row_to_dict(row)
+                    note['snippet'] = row[-1]
+                    notes.append(note)
+                return notes
+        except sqlite3.OperationalError:
+            return self._search_notes_like(query, limit, offset)
+    
+    def _build_fts_query(self, query):
+        """Kullanıcı sorgusunu güvenli FTS5 ifadesine çevir"""
+        terms = []
+        for phrase, word in re.findall(r'"([^"]+)"|(\S+)', query):
+            if phrase:
+                terms.append('"%s"' % phrase.replace('"', '""'))
+            else:
+                prefix = word.endswith('*')
+                word = word.strip('*"')
+                if word:
+                    terms.append('"%s"%s' % (word, '*' if prefix else ''))
+        return ' '.join(terms)
+    
+    def _search_notes_like(self, query, limit=-1, offset=0):
+        """FTS5 olmadan LIKE ile arama"""
+        with self.connections.get() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT * FROM notes 
                 WHERE title LIKE ? OR content LIKE ? OR tags LIKE ? 
                 OR source_title LIKE ? OR source_authors LIKE ?
-                ORDER BY modified_date DESC
-            ''', (f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%'))
+                ORDER BY modified_date DESC, id DESC
+                LIMIT ? OFFSET ?
+            ''', (f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%', limit, offset))
             return [self._row_to_dict(row) for row in cursor.fetchall()]
     
     def update_note(self, note_id, note_data):
         """Notu güncelle"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.connections.get() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 UPDATE notes 
                 SET title=?, content=?, source_title=?, source_url=?, source_authors=?, 
-                    source_year=?, page_reference=?, tags=?, modified_date=?
+                    source_year=?, page_reference=?, tags=?, modified_date=?,
+                    summary=CASE WHEN content=? THEN summary END
                 WHERE id=?
             ''', (
                 note_data['title'],
@@ -123,373 +430,1776 @@ class DatabaseManager:
                 note_data.get('page_reference', ''),
                 note_data.get('tags', ''),
                 datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                note_data['content'],  # İçerik değiştiyse eski özet geçersiz
                 note_id
             ))
     
     def delete_note(self, note_id):
         """Notu sil"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.connections.get() as conn:
             cursor = conn.cursor()
             cursor.execute('DELETE FROM notes WHERE id=?', (note_id,))
     
+    def get_notes_without_summary(self):
+        """Toplu özeti henüz çıkarılmamış notlar"""
+        with self.connections.get() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT * FROM notes WHERE summary IS NULL ORDER BY id')
+            return [self._row_to_dict(row) for row in cursor.fetchall()]
+    
+    def update_note_summaries(self, summaries):
+        """(note_id, özet) çiftlerini tek işlemde kaydet"""
+        with self.transaction() as conn:
+            conn.executemany('UPDATE notes SET summary=? WHERE id=?',
+                             [(summary, note_id) for note_id, summary in summaries])
+    
+    def get_cached_summary(self, content_hash, kind):
+        """Kaydedilmiş özeti getir (yoksa None)"""
+        with self.connections.get() as conn:
+            row = conn.execute(
+                'SELECT result FROM summary_cache WHERE content_hash=? AND kind=?',
+                (content_hash, kind)
+            ).fetchone()
+            return row[0] if row else None
+    
+    def save_cached_summary(self, content_hash, kind, result):
+        """Özeti önbellek tablosuna yaz; satır sınırını aşan en eski kayıtları sil"""
+        with self.connections.get() as conn:
+            conn.execute('''
+                INSERT OR REPLACE INTO summary_cache (content_hash, kind, result, created_date)
+                VALUES (?, ?, ?, ?)
+            ''', (content_hash, kind, result, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+            conn.execute('''
+                DELETE FROM summary_cache WHERE rowid IN (
+                    SELECT rowid FROM summary_cache ORDER BY created_date DESC, rowid DESC
+                    LIMIT -1 OFFSET ?
+                )
+            ''', (self.SUMMARY_CACHE_MAX_ROWS,))
+    
     def _row_to_dict(self, row):
         """SQL satırını dictionary'e çevir"""
         return {
             'id': row[0], 'title': row[1], 'content': row[2], 'source_title': row[3],
             'source_url': row[4], 'source_authors': row[5], 'source_year': row[6],
             'page_reference': row[7], 'tags': row[8], 'created_date': row[9],
-            'modified_date': row[10]
+            'modified_date': row[10], 'summary': row[11]
+        }
+
+
+class SearchCache:
+    """Arama sonuçları önbelleği (SQLite, kaynak bazlı TTL + LRU)"""
+    
+    # Kaynak başına geçerlilik süresi (saniye)
+    SOURCE_TTLS = {
+        'ArXiv': 6 * 3600,
+        'Crossref': 24 * 3600,
+        'DOAJ': 24 * 3600,
+        'DergiPark': 12 * 3600
+    }
+    DEFAULT_TTL = 7 * 24 * 3600  # Sadece link üreten kaynaklar nadiren değişir
+    
+    def __init__(self, db_path="search_cache.db", max_entries=2000):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self._lock = threading.Lock()
+        self.connections = ConnectionManager(db_path)
+        self.init_database()
+    
+    def init_database(self):
+        """Önbellek tablosunu oluştur"""
+        with self.connections.get() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    source TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    max_results INTEGER NOT NULL,
+                    results TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (source, query, max_results)
+                )
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_search_cache_last_access
+                ON search_cache(last_access)
+            ''')
+            conn.commit()
+    
+    @staticmethod
+    def normalize_query(query):
+        """Sorguyu anahtar için normalize et (küçük harf, tek boşluk)"""
+        return ' '.join(query.lower().split())
+    
+    def get(self, source, query, max_results, allow_stale=False):
+        """Önbellekteki sonuçları getir; yoksa veya süresi dolmuşsa None.
+        
+        allow_stale=True süresi dolmuş kayıtları da döndürür (çevrimdışı yedek).
+        """
+        key = (source, self.normalize_query(query), max_results)
+        now = time.time()
+        with self._lock, self.connections.get() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT results, created_at FROM search_cache
+                WHERE source=? AND query=? AND max_results=?
+            ''', key)
+            row = cursor.fetchone()
+            
+            fresh = row is not None and now - row[1] <= self.SOURCE_TTLS.get(source, self.DEFAULT_TTL)
+            if allow_stale:
+                if row is None:
+                    return None
+                self.stale_hits += 1
+            elif not fresh:
+                self.misses += 1
+                return None
+            else:
+                self.hits += 1
+            
+            cursor.execute('''
+                UPDATE search_cache SET last_access=?
+                WHERE source=? AND query=? AND max_results=?
+            ''', (now,) + key)
+            return [SearchResult.from_dict(item) for item in json_loads(row[0])]
+    
+    def set(self, source, query, max_results, results):
+        """Sonuçları önbelleğe yaz ve LRU sınırını uygula"""
+        now = time.time()
+        with self._lock, self.connections.get() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO search_cache
+                (source, query, max_results, results, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (source, self.normalize_query(query), max_results,
+                  json.dumps([item.to_dict() for item in results], ensure_ascii=False), now, now))
+            
+            # En uzun süredir kullanılmayan kayıtları sil
+            cursor.execute('''
+                DELETE FROM search_cache WHERE rowid IN (
+                    SELECT rowid FROM search_cache ORDER BY last_access DESC
+                    LIMIT -1 OFFSET ?
+                )
+            ''', (self.max_entries,))
+    
+    def clear(self):
+        """Önbelleği temizle"""
+        with self._lock, self.connections.get() as conn:
+            conn.execute('DELETE FROM search_cache')
+    
+    def close(self):
+        """Önbellek bağlantılarını kapat"""
+        self.connections.close()
+    
+    def stats(self):
+        """İsabet/ıska sayaçları"""
+        with self.connections.get() as conn:
+            entries = conn.execute('SELECT COUNT(*) FROM search_cache').fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale_hits': self.stale_hits,
+            'entries': entries,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+class SearchResult:
+    """Arama sonucu kaydı
+    
+    Yıl her zaman tamsayıdır (bilinmiyorsa 0); sıralama anahtarları kayıt
+    oluşturulurken hesaplanır. __slots__ sayesinde kayıt başına bellek
+    sözlüğe göre belirgin biçimde azdır.
+    """
+    
+    __slots__ = ('title', 'authors', 'year', 'source', 'link', 'doi', 'arxiv_id',
+                 'sources', 'links', 'title_key')
+    
+    def __init__(self, title='', authors='', year=0, source='', link='', doi='', arxiv_id=''):
+        self.title = title or ''
+        self.authors = authors or ''
+        self.year = self.parse_year(year)
+        self.source = source or ''
+        self.link = link or ''
+        self.doi = doi or ''
+        self.arxiv_id = arxiv_id or ''
+        self.sources = (self.source,) if self.source else ()
+        self.links = (self.link,) if self.link else ()
+        self.title_key = self.title.lower()
+    
+    @staticmethod
+    def parse_year(value):
+        """Yılı tamsayıya çevir; geçersizse 0"""
+        if isinstance(value, int):
+            return value
+        value = str(value or '').strip()
+        return int(value) if value.isdigit() else 0
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Sözlükten (ör. önbellek kaydı) oluştur"""
+        result = cls(data.get('title'), data.get('authors'), data.get('year'), data.get('source'),
+                     data.get('link'), data.get('doi'), data.get('arxiv_id'))
+        if data.get('sources'):
+            result.sources = tuple(data['sources'])
+        if data.get('links'):
+            result.links = tuple(data['links'])
+        return result
+    
+    def to_dict(self):
+        """JSON'a yazılabilir sözlük (yıl bilinmiyorsa None)"""
+        return {
+            'title': self.title, 'authors': self.authors, 'year': self.year or None,
+            'source': self.source, 'link': self.link, 'doi': self.doi,
+            'arxiv_id': self.arxiv_id, 'sources': list(self.sources), 'links': list(self.links)
+        }
+    
+    def copy(self):
+        """Sığ kopya (kaynak/link demetleri değiştirilemez, paylaşılabilir)"""
+        result = SearchResult.__new__(SearchResult)
+        for name in self.__slots__:
+            setattr(result, name, getattr(self, name))
+        return result
+    
+    def __repr__(self):
+        return f"SearchResult({self.title!r}, {self.year}, {self.source!r})"
+
+
+class ResultDeduplicator:
+    """Kaynaklar arası tekrar eden kayıtları birleştirme motoru
+    
+    Kayıtlar DOI, arXiv kimliği ve normalize başlık+yıl parmak izi ile
+    eşleştirilir. Yalnızca parmak iziyle eşleşen iki kayıt farklı DOI ya da
+    arXiv kimliği taşıyorsa birleştirilmez ("Editorial Board" gibi her yıl
+    tekrarlanan başlıklar). Anahtarlar sözlükte tutulduğu için işlem O(n)'dir
+    ve sonuçlar kaynak kaynak geldikçe artımlı olarak eklenebilir.
+    """
+    
+    ARXIV_DOI_RE = re.compile(r'^10\.48550/arxiv\.(.+)$', re.IGNORECASE)
+    ARXIV_URL_RE = re.compile(r'arxiv\.org/(?:abs|pdf)/(.+?)(?:v\d+)?(?:\.pdf)?$', re.IGNORECASE)
+    DOI_PREFIX_RE = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi:)', re.IGNORECASE)
+    MIN_FINGERPRINT_LENGTH = 12  # Çok kısa başlıklar yanlış eşleşmeye yol açar
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """İndeksi ve kayıtları temizle"""
+        self.records = []
+        self._index = {}
+    
+    @classmethod
+    def arxiv_id_from_url(cls, url):
+        """arXiv URL'sinden sürüm numarasız kimliği çıkar"""
+        match = cls.ARXIV_URL_RE.search(url or '')
+        return match.group(1) if match else ''
+    
+    @classmethod
+    def normalize_doi(cls, doi):
+        """DOI'yi karşılaştırma için normalize et"""
+        return cls.DOI_PREFIX_RE.sub('', (doi or '').strip()).lower()
+    
+    @staticmethod
+    def title_fingerprint(title):
+        """Başlığı aksan, noktalama ve büyük/küçük harften arındır"""
+        normalized = unicodedata.normalize('NFKD', (title or '').lower().replace('ı', 'i'))
+        normalized = ''.join(c for c in normalized if not unicodedata.combining(c))
+        return ' '.join(re.sub(r'[^\w]+', ' ', normalized).split())
+    
+    def _identifiers(self, item):
+        """Kaydın normalize (DOI, arXiv kimliği) çifti; olmayan boş metin"""
+        doi = self.normalize_doi(item.doi)
+        arxiv_id = item.arxiv_id
+        if doi and not arxiv_id:
+            match = self.ARXIV_DOI_RE.match(doi)
+            arxiv_id = match.group(1) if match else ''
+        return doi, arxiv_id.lower()
+    
+    def _conflicts(self, record, item):
+        """İki kayıt farklı DOI ya da farklı arXiv kimliği taşıyor mu"""
+        return any(a and b and a != b
+                   for a, b in zip(self._identifiers(record), self._identifiers(item)))
+    
+    def _keys(self, item):
+        """Kaydın eşleştirme anahtarları"""
+        keys = []
+        doi, arxiv_id = self._identifiers(item)
+        if doi:
+            keys.append(('doi', doi))
+        if arxiv_id:
+            keys.append(('arxiv', arxiv_id))
+        
+        fingerprint = self.title_fingerprint(item.title)
+        if len(fingerprint) >= self.MIN_FINGERPRINT_LENGTH:
+            keys.append(('title', fingerprint, item.year))
+        return keys
+    
+    def _merge(self, record, item):
+        """Tekrar eden kaydı mevcut kayda birleştir"""
+        for source in item.sources:
+            if source not in record.sources:
+                record.sources += (source,)
+                record.source = ', '.join(record.sources)
+        for link in item.links:
+            if link not in record.links:
+                record.links += (link,)
+        for field in ('authors', 'year', 'doi', 'arxiv_id'):
+            if not getattr(record, field) and getattr(item, field):
+                setattr(record, field, getattr(item, field))
+    
+    def _find(self, keys, item):
+        """Anahtarlardan eşleşen kayıt; parmak izi eşleşmesi kimlik çelişkisinde sayılmaz"""
+        for key in keys:
+            record = self._index.get(key)
+            if record is not None and (key[0] != 'title' or not self._conflicts(record, item)):
+                return record
+        return None
+    
+    def add(self, results):
+        """Sonuçları ekle; (yeni_kayıtlar, güncellenen_kayıtlar) döndür"""
+        new_records = []
+        merged_records = []
+        touched = set()
+        for item in results:
+            keys = self._keys(item)
+            record = self._find(keys, item)
+            
+            if record is None:
+                record = item.copy()
+                self.records.append(record)
+                new_records.append(record)
+                touched.add(id(record))
+            else:
+                self._merge(record, item)
+                if id(record) not in touched:
+                    merged_records.append(record)
+                    touched.add(id(record))
+                keys = self._keys(record)  # Birleşen alanlar yeni anahtar getirebilir
+            
+            for key in keys:
+                self._index.setdefault(key, record)
+        return new_records, merged_records
+    
+    def deduplicate(self, results):
+        """Tek seferde tekilleştir"""
+        self.reset()
+        self.add(results)
+        return self.records
+
+
+class ResultProcessor:
+    """Sonuç filtreleme ve sıralama kuralları (GUI'den bağımsız)"""
+    
+    # Sıralama ölçütü -> SearchResult'ta önceden hesaplanmış anahtar
+    SORT_KEYS = {
+        'year': operator.attrgetter('year'),
+        'title': operator.attrgetter('title_key'),
+        'source': operator.attrgetter('source')
+    }
+    
+    def __init__(self, year_from='', year_to='', sort_by='year', sort_order='desc'):
+        self.year_from = year_from
+        self.year_to = year_to
+        self.sort_by = sort_by
+        self.sort_order = sort_order
+    
+    @staticmethod
+    def _year_bound(value):
+        """Arayüz/komut satırı yıl sınırını tamsayıya çevir (geçersizse None)"""
+        value = (value or '').strip()
+        return int(value) if value.isdigit() else None
+    
+    def filter(self, results):
+        """Sonuçları yıl aralığına göre filtrele (yılı bilinmeyenler kalır)"""
+        year_from = self._year_bound(self.year_from)
+        year_to = self._year_bound(self.year_to)
+        
+        if year_from is None and year_to is None:
+            return results
+        
+        lower = year_from if year_from is not None else 0
+        upper = year_to if year_to is not None else float('inf')
+        return [item for item in results if not item.year or lower <= item.year <= upper]
+    
+    def matches(self, item):
+        """Tek kaydın filtreden geçip geçmediği"""
+        return bool(self.filter([item]))
+    
+    def sort_key_func(self):
+        """Sıralama anahtarı fonksiyonu"""
+        return self.SORT_KEYS.get(self.sort_by)
+    
+    @property
+    def descending(self):
+        return self.sort_order == 'desc'
+    
+    def sort(self, results):
+        """Sonuçları sırala"""
+        key_func = self.sort_key_func()
+        if key_func is None:
+            return results
+        return sorted(results, key=key_func, reverse=self.descending)
+    
+    def process(self, results):
+        """Filtrele -> tekilleştir -> sırala"""
+        return self.sort(ResultDeduplicator().deduplicate(self.filter(results)))
+
+
+class SortIndex:
+    """Tek bir sıralama anahtarına göre artan sırada tutulan kayıt indeksi
+    
+    Kayıtlar geldikçe bisect ile yerine eklenir; sıralama ölçütü değiştiğinde
+    liste yeniden sıralanmak yerine doğrudan (gerekirse ters) okunur.
+    Birleşme sonucu anahtarı değişen kayıt update() ile yeniden konumlanır.
+    """
+    
+    def __init__(self, key_func):
+        self.key_func = key_func
+        self.keys = []
+        self.records = []
+        self._record_keys = {}
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def add(self, record):
+        """Kaydı anahtarına göre yerine ekle"""
+        key = self.key_func(record)
+        position = bisect.bisect_right(self.keys, key)
+        self.keys.insert(position, key)
+        self.records.insert(position, record)
+        self._record_keys[id(record)] = key
+    
+    def update(self, record):
+        """Anahtarı değiştiyse kaydı yeniden konumlandır; değişti mi döndür"""
+        old_key = self._record_keys.get(id(record))
+        if old_key is None:
+            self.add(record)
+            return True
+        if self.key_func(record) == old_key:
+            return False
+        
+        low = bisect.bisect_left(self.keys, old_key)
+        high = bisect.bisect_right(self.keys, old_key)
+        for position in range(low, high):
+            if self.records[position] is record:
+                del self.keys[position]
+                del self.records[position]
+                break
+        self.add(record)
+        return True
+    
+    def ordered(self, descending=False):
+        """Kayıtları sıralı liste olarak döndür"""
+        return self.records[::-1] if descending else list(self.records)
+
+
+class SearchCallTrace:
+    """Tek bir SearchEngine.search çağrısında yapılan isteklerin kaydı
+    
+    Sayfalı kaynaklarda birden çok thread aynı kayda yazar; yalnızca
+    list.append kullanıldığı için kilit gerekmez.
+    """
+    
+    __slots__ = ('responses', 'parse_times', 'call_times', 'error', 'timeout')
+    
+    def __init__(self, timeout=None):
+        self.responses = []
+        self.parse_times = []
+        self.call_times = []  # Kaynak fonksiyonu çağrı süreleri (hız sınırı beklemesi hariç)
+        self.error = None
+        self.timeout = timeout
+    
+    @property
+    def failed(self):
+        """Kaynak sağlığı açısından başarısız mı (hata, 5xx veya 429)"""
+        status = self.status
+        return self.error is not None or (status is not None and (status >= 500 or status == 429))
+    
+    @property
+    def latency(self):
+        """Çağrının gecikmesi: kaynak fonksiyonlarında geçen sürelerin toplamı
+        
+        Hız sınırlayıcı beklemeleri her iki yolda da (tek istek, sayfalı) dahil
+        değildir; sayfalı kaynaklarda sayfa istekleri toplanır.
+        """
+        return sum(self.call_times)
+    
+    @property
+    def latencies(self):
+        """İstek başına yanıt başlıklarına kadar geçen süreler (saniye)"""
+        return [response.elapsed.total_seconds() for response in self.responses]
+    
+    @property
+    def status(self):
+        """Son başarısız durum kodu; hepsi başarılıysa sonuncusu (istek yoksa None)"""
+        statuses = [response.status_code for response in self.responses]
+        failed = [status for status in statuses if status >= 400]
+        return failed[-1] if failed else (statuses[-1] if statuses else None)
+    
+    @property
+    def bytes_received(self):
+        """Ağdan okunan (sıkıştırılmış) gövde baytları"""
+        total = 0
+        for response in self.responses:
+            try:
+                total += response.raw.tell()
+            except Exception:
+                total += int(response.headers.get('Content-Length') or 0)
+        return total
+
+
+class SourceParseError(ValueError):
+    """Kaynağın başarılı (200) yanıtı beklenen biçimde değil"""
+
+
+class SourceMetrics:
+    """Bir kaynağın biriken ölçümleri"""
+    
+    RECENT_SIZE = 200  # Yüzdelikler için saklanan son gecikme sayısı
+    
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.calls = 0
+        self.cache_hits = 0
+        self.skipped = 0  # Devre açıkken atlanan çağrılar
+        self.errors = 0
+        self.empty = 0
+        self.results = 0
+        self.bytes_received = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.parse_time_total = 0.0
+        self.histogram = [0] * (len(buckets) + 1)
+        self.statuses = {}
+        self.exceptions = {}
+        self.last_status = None
+        self.last_error = ''
+        self.recent = deque(maxlen=self.RECENT_SIZE)
+    
+    def percentile(self, fraction):
+        """Son çağrıların gecikme yüzdeliği (saniye; veri yoksa None)"""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+    
+    def to_dict(self):
+        network_calls = self.calls - self.cache_hits - self.skipped
+        return {
+            'calls': self.calls,
+            'cache_hits': self.cache_hits,
+            'skipped': self.skipped,
+            'errors': self.errors,
+            'empty': self.empty,
+            'results': self.results,
+            'bytes_received': self.bytes_received,
+            'latency_mean': self.latency_total / network_calls if network_calls else None,
+            'latency_p50': self.percentile(0.5),
+            'latency_p95': self.percentile(0.95),
+            'latency_max': self.latency_max,
+            'parse_time_mean': self.parse_time_total / network_calls if network_calls else None,
+            'latency_histogram': {
+                (f'<={bound:g}s' if bound != float('inf') else f'>{self.buckets[-1]:g}s'): count
+                for bound, count in zip(self.buckets + (float('inf'),), self.histogram)
+            },
+            'statuses': {str(status): count for status, count in self.statuses.items()},
+            'exceptions': dict(self.exceptions),
+            'last_status': self.last_status,
+            'last_error': self.last_error
         }
 
 
+class SearchMetrics:
+    """Kaynak bazlı arama ölçümleri (thread-safe)
+    
+    Her SearchEngine.search çağrısı için gecikme, HTTP durum kodu, alınan
+    bayt, ayrıştırma süresi, sonuç sayısı ve hata sınıfı kaydedilir.
+    Önbellekten dönen çağrılar gecikme istatistiklerine katılmaz.
+    """
+    
+    LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)  # saniye
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Tüm ölçümleri sıfırla"""
+        with self._lock:
+            self._sources = {}
+            self.started_at = time.time()
+    
+    def source(self, source):
+        """Kaynağın ölçüm nesnesi (yoksa oluştur)"""
+        with self._lock:
+            metrics = self._sources.get(source)
+            if metrics is None:
+                metrics = SourceMetrics(self.LATENCY_BUCKETS)
+                self._sources[source] = metrics
+            return metrics
+    
+    @staticmethod
+    def error_name(error):
+        """Ölçümde gösterilecek hata sınıfı
+        
+        requests, urllib3'ün MaxRetryError ile sardığı okuma zaman aşımını
+        ConnectionError olarak fırlatır; asıl neden (reason) ayrı adla yazılır ki
+        zaman aşımı reddedilen bağlantıdan ayırt edilebilsin. NewConnectionError
+        urllib3'te ConnectTimeoutError alt sınıfı olduğu için önce denetlenir.
+        """
+        inner = error.args[0] if isinstance(error, requests.RequestException) and error.args else None
+        reason = getattr(inner, 'reason', None)
+        if isinstance(reason, NewConnectionError):
+            return type(error).__name__
+        if isinstance(reason, ReadTimeoutError):
+            return 'ReadTimeout'
+        if isinstance(reason, ConnectTimeoutError):
+            return 'ConnectTimeout'
+        return type(error).__name__
+    
+    def record(self, source, latency, results=0, status=None, bytes_received=0,
+               parse_time=0.0, error=None, cached=False, skipped=False):
+        """Tek arama çağrısının ölçümünü ekle"""
+        metrics = self.source(source)
+        with self._lock:
+            metrics.calls += 1
+            metrics.results += results
+            if results == 0:
+                metrics.empty += 1
+            if cached or skipped:
+                if cached:
+                    metrics.cache_hits += 1
+                else:
+                    metrics.skipped += 1
+                return
+            
+            metrics.latency_total += latency
+            metrics.latency_max = max(metrics.latency_max, latency)
+            metrics.histogram[bisect.bisect_left(self.LATENCY_BUCKETS, latency)] += 1
+            metrics.recent.append(latency)
+            metrics.parse_time_total += parse_time
+            metrics.bytes_received += bytes_received
+            if status is not None:
+                metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+                metrics.last_status = status
+            if error is not None:
+                name = self.error_name(error)
+                metrics.errors += 1
+                metrics.exceptions[name] = metrics.exceptions.get(name, 0) + 1
+                metrics.last_error = f"{name}: {error}"
+    
+    def snapshot(self):
+        """Tüm kaynakların ölçümleri (JSON'a yazılabilir sözlük)"""
+        with self._lock:
+            return {
+                'started_at': datetime.fromtimestamp(self.started_at).isoformat(timespec='seconds'),
+                'sources': {source: metrics.to_dict() for source, metrics in sorted(self._sources.items())}
+            }
+    
+
+
+class SourceHealth:
+    """Kaynak sağlık izleyici: uyarlanan zaman aşımı + devre kesici
+    
+    Zaman aşımı, başarılı isteklerin p95 gecikmesinin TIMEOUT_MULTIPLIER
+    katıdır (varsayılan üst sınırı aşmaz). Art arda FAILURE_THRESHOLD hata
+    devreyi açar ve kaynak atlanır. Bekleme dolunca tek bir deneme isteğine
+    izin verilir (yarı açık): başarılıysa devre kapanır, değilse bekleme
+    süresi ikiye katlanarak devre yeniden açılır.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    FAILURE_THRESHOLD = 3
+    OPEN_SECONDS = 30.0
+    MAX_OPEN_SECONDS = 300.0
+    MIN_SAMPLES = 5           # Bu kadar ölçüm olmadan varsayılan zaman aşımı kullanılır
+    SAMPLE_SIZE = 100
+    TIMEOUT_MULTIPLIER = 3.0
+    MIN_TIMEOUT = 2.0
+    
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=self.SAMPLE_SIZE)
+        self._probe_in_flight = False
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.open_seconds = self.OPEN_SECONDS
+        self.opened_until = 0.0
+    
+    def allow_request(self):
+        """İstek yapılabilir mi (yarı açıkta yalnızca tek deneme isteği)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self._clock() >= self.opened_until:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+    
+    def record_success(self, latencies=()):
+        """Başarılı çağrı: devreyi kapat, gecikmeleri örneklere ekle"""
+        with self._lock:
+            self._latencies.extend(latencies)
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.open_seconds = self.OPEN_SECONDS
+            self._probe_in_flight = False
+    
+    def record_failure(self):
+        """Başarısız çağrı: eşik aşıldıysa veya deneme başarısızsa devreyi aç"""
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN:
+                self.open_seconds = min(self.open_seconds * 2, self.MAX_OPEN_SECONDS)
+                self._open()
+            elif self.state == self.CLOSED and self.consecutive_failures >= self.FAILURE_THRESHOLD:
+                self._open()
+    
+    def _open(self):
+        self.state = self.OPEN
+        self.opened_until = self._clock() + self.open_seconds
+        self._probe_in_flight = False
+    
+    def p95(self):
+        """Başarılı isteklerin p95 gecikmesi (yeterli örnek yoksa None)"""
+        with self._lock:
+            if len(self._latencies) < self.MIN_SAMPLES:
+                return None
+            ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+    
+    def timeout(self, default):
+        """İstek zaman aşımı: p95 * çarpan, [MIN_TIMEOUT, default] aralığında"""
+        p95 = self.p95()
+        if p95 is None:
+            return default
+        return min(default, max(self.MIN_TIMEOUT, p95 * self.TIMEOUT_MULTIPLIER))
+    
+    def retry_in(self):
+        """Açık devrenin yeniden denenmesine kalan süre (saniye)"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.opened_until - self._clock())
+    
+    def to_dict(self, default_timeout):
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'retry_in': round(self.retry_in(), 1),
+            'latency_p95': self.p95(),
+            'timeout': self.timeout(default_timeout)
+        }
+
+
+class RateLimiter:
+    """Kaynak başına istek hızı sınırlayıcı (thread-safe)"""
+    
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def wait(self):
+        """Sıradaki istek zamanına kadar bekle"""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+class SearchRetry(Retry):
+    """Arama istekleri için sınırlı bekleme süreli yeniden deneme politikası
+    
+    Retry-After ve üstel geri çekilme beklemeleri MAX_WAIT ile sınırlanır;
+    tek bir '503 Retry-After: 600' yanıtı aramayı dakikalarca bekletmez.
+    Zaman aşımları hiç yeniden denenmez. İsteği yapan thread için bir süre
+    sınırı verildiyse (set_deadline), beklemesi sınırı aşacak yeniden deneme
+    yapılmaz ve son yanıt döndürülür: istek, yeniden denemeleriyle birlikte
+    kaynağın zaman aşımı içinde kalır.
+    """
+    
+    MAX_WAIT = 5.0  # saniye
+    _deadlines = threading.local()
+    
+    @classmethod
+    def set_deadline(cls, deadline):
+        """Bu thread'in isteği için son an (time.monotonic); None: sınır yok"""
+        cls._deadlines.value = deadline
+    
+    @classmethod
+    def remaining_time(cls):
+        deadline = getattr(cls._deadlines, 'value', None)
+        return None if deadline is None else deadline - time.monotonic()
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # NewConnectionError (bağlantı reddi) urllib3'te ConnectTimeoutError alt sınıfıdır;
+        # zaman aşımı sayılmaz, connect sayacıyla yeniden denenir
+        if (isinstance(error, (ConnectTimeoutError, ReadTimeoutError))
+                and not isinstance(error, NewConnectionError)):
+            raise MaxRetryError(_pool, url, error)
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        
+        remaining = self.remaining_time()
+        if remaining is not None:
+            wait = None
+            if response is not None and self.respect_retry_after_header:
+                wait = retry.get_retry_after(response)
+            if wait is None:
+                wait = retry.get_backoff_time()
+            if wait >= remaining:
+                # raise_on_status=False: urllib3 son yanıtı döndürür
+                raise MaxRetryError(_pool, url, error or ResponseError('süre sınırı doldu'))
+        return retry
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.MAX_WAIT)
+    
+    def get_backoff_time(self):
+        return min(super().get_backoff_time(), self.MAX_WAIT)
+
+
+class SourcePlugin:
+    """Arama kaynağı tanımı ve yetenekleri
+    
+    Ağ kaynakları search(engine, query, max_results) ile ya da sayfalı ise
+    fetch_page ile tanımlanır. Offset sayfalamada fetch_page(engine, query,
+    index, page_size) kayıt listesi döndürür. Cursor sayfalamada
+    fetch_page(engine, query, cursor, rows) (kayıtlar, sonraki_cursor)
+    döndürür; ilk cursor '*'dır. Fonksiyon yerine metin verilirse aynı adlı
+    SearchEngine metodu kullanılır.
+    
+    Kayıtlar SearchResult ya da SearchResult.from_dict ile okunabilen sözlük
+    (title, authors, year, link, doi, arxiv_id; source verilmezse kaynak adı)
+    olmalıdır. Sözlükler SearchResult'a çevrilir; başka türde kayıt TypeError
+    ile reddedilir ve kaynağın hatası olarak ölçüme yazılır.
+    
+    link verilen kaynaklar yalnızca sorgu linki üretir (ağ isteği yok).
+    title ve link şablonlarında {query} ham sorgu, {q} URL'e kodlanmış
+    sorgudur.
+    """
+    
+    OFFSET = 'offset'
+    CURSOR = 'cursor'
+    
+    def __init__(self, name, search=None, fetch_page=None, pagination=None, page_size=100,
+                 link=None, title='{query}', authors='', rate_limit=None, language='intl',
+                 enabled=False):
+        if link is None and search is None and fetch_page is None:
+            raise ValueError(f"{name}: search, fetch_page veya link gerekli")
+        if fetch_page is not None and pagination not in (self.OFFSET, self.CURSOR):
+            raise ValueError(f"{name}: pagination '{self.OFFSET}' ya da '{self.CURSOR}' olmalı")
+        self.name = name
+        self.search = search
+        self.fetch_page = fetch_page
+        self.pagination = pagination if fetch_page is not None else None
+        self.page_size = page_size
+        self.link = link
+        self.title = title
+        self.authors = authors
+        self.rate_limit = rate_limit  # İstekler arası minimum süre (saniye); None: varsayılan
+        self.language = language      # 'tr' veya 'intl' (arayüzdeki hızlı seçim)
+        self.enabled = enabled        # Arayüzde varsayılan olarak seçili mi
+    
+    @property
+    def network(self):
+        """Ağ isteği yapan kaynak mı"""
+        return self.link is None
+    
+    @property
+    def paginated(self):
+        return self.pagination is not None
+    
+    def normalize_results(self, records):
+        """Eklentinin döndürdüğü kayıtları SearchResult listesine çevir"""
+        results = []
+        for record in records or ():
+            if isinstance(record, SearchResult):
+                results.append(record)
+            elif isinstance(record, dict):
+                if not record.get('source'):
+                    record = dict(record, source=self.name)
+                results.append(SearchResult.from_dict(record))
+            else:
+                raise TypeError(f"{self.name}: kayıtlar SearchResult ya da dict olmalı, "
+                                f"{type(record).__name__} döndü")
+        return results
+    
+    def resolve_links(self, query):
+        """Link kaynağının sonucunu hemen üret"""
+        quoted = requests.utils.quote(query)
+        return [SearchResult(
+            title=self.title.format(query=query, q=quoted),
+            authors=self.authors,
+            year=datetime.now().year,
+            source=self.name,
+            link=self.link.format(query=query, q=quoted)
+        )]
+    
+    def capabilities(self):
+        """Yetenek bilgisi (tanılama/komut satırı listesi için)"""
+        return {
+            'network': self.network,
+            'paginated': self.paginated,
+            'pagination': self.pagination,
+            'rate_limit': self.rate_limit,
+            'language': self.language
+        }
+    
+    def __repr__(self):
+        return f"SourcePlugin({self.name!r}, network={self.network}, paginated={self.paginated})"
+
+
+class SourceRegistry:
+    """Kaynak eklentileri kaydı (kayıt sırası korunur)
+    
+    Kurulu paketler ENTRY_POINT_GROUP grubunda bir SourcePlugin, bunların
+    listesi veya bunları döndüren bir fonksiyon yayınlayarak kaynak
+    ekleyebilir. Yüklenemeyen eklentiler atlanır ve load_errors'a yazılır.
+    """
+    
+    ENTRY_POINT_GROUP = 'academic_searcher.sources'
+    
+    def __init__(self, plugins=()):
+        self._plugins = {}
+        self.load_errors = []
+        for plugin in plugins:
+            self.register(plugin)
+    
+    def register(self, plugin, replace=False):
+        """Kaynak ekle; aynı adlı kaynak varsa replace=True gerekir"""
+        if not isinstance(plugin, SourcePlugin):
+            raise TypeError(f"SourcePlugin bekleniyordu: {plugin!r}")
+        if plugin.name in self._plugins and not replace:
+            raise ValueError(f"Kaynak zaten kayıtlı: {plugin.name}")
+        self._plugins[plugin.name] = plugin
+    
+    def get(self, name):
+        return self._plugins.get(name)
+    
+    def __contains__(self, name):
+        return name in self._plugins
+    
+    def __iter__(self):
+        return iter(self._plugins.values())
+    
+    def names(self):
+        return list(self._plugins)
+    
+    def load_entry_points(self, group=None):
+        """Kurulu eklentileri yükle; eklenen kaynak sayısını döndür"""
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:
+            return 0
+        
+        group = group or self.ENTRY_POINT_GROUP
+        found = entry_points()
+        if hasattr(found, 'select'):
+            found = found.select(group=group)
+        else:  # Python 3.8/3.9: grup -> liste sözlüğü
+            found = found.get(group, [])
+        
+        added = 0
+        for entry_point in found:
+            try:
+                loaded = entry_point.load()
+                if callable(loaded) and not isinstance(loaded, SourcePlugin):
+                    loaded = loaded()
+                plugins = [loaded] if isinstance(loaded, SourcePlugin) else list(loaded)
+                for plugin in plugins:
+                    self.register(plugin)
+                    added += 1
+            except Exception as e:
+                self.load_errors.append(f"{entry_point.name}: {type(e).__name__}: {e}")
+        return added
+
+
+# Yerleşik kaynaklar
+BUILTIN_SOURCES = (
+    SourcePlugin('DOAJ', fetch_page='_fetch_doaj_page', pagination=SourcePlugin.OFFSET,
+                 page_size=100, rate_limit=0.5, enabled=True),  # DOAJ pageSize üst sınırı 100
+    SourcePlugin('ArXiv', fetch_page='_fetch_arxiv_page', pagination=SourcePlugin.OFFSET,
+                 page_size=200, rate_limit=3.0, enabled=True),  # arXiv API kuralı: 3 saniyede bir istek
+    SourcePlugin('Crossref', fetch_page='_fetch_crossref_page', pagination=SourcePlugin.CURSOR,
+                 page_size=200, rate_limit=0.2, enabled=True),
+    SourcePlugin('PubMed', title='PubMed: {query}', authors='NCBI',
+                 link='https://pubmed.ncbi.nlm.nih.gov/?term={q}'),
+    SourcePlugin('IEEE', title='IEEE Xplore: {query}', authors='IEEE',
+                 link='https://ieeexplore.ieee.org/search/searchresult.jsp?newsearch=true&queryText={q}'),
+    SourcePlugin('MIT', title='MIT Libraries: {query}', authors='MIT Libraries',
+                 link='https://libraries.mit.edu/search/?q={q}'),
+    SourcePlugin('DergiPark', fetch_page='_fetch_dergipark_page', pagination=SourcePlugin.OFFSET,
+                 page_size=20, rate_limit=1.0, language='tr'),  # Site sayfada en az 20 sonuç gösterir
+    SourcePlugin('TÜBİTAK', title='TÜBİTAK: {query}', authors='ULAKBİM', language='tr',
+                 link='https://uvt.ulakbim.gov.tr/uvt/index.php?cwid=2&vtadi=TPRJ&query={q}'),
+    SourcePlugin('ODTÜ', title='ODTÜ: {query}', authors='ODTÜ Akademik', language='tr',
+                 link='https://dspace.metu.edu.tr/handle/11511?query={q}'),
+    SourcePlugin('İTÜ', title='İTÜ: {query}', authors='İTÜ Akademik', language='tr',
+                 link='https://acikarsiv.itu.edu.tr/handle?query={q}'),
+    SourcePlugin('Boğaziçi', title='Boğaziçi: {query}', authors='Boğaziçi Üniversitesi', language='tr',
+                 link='https://openaccess.boun.edu.tr/handle?query={q}'),
+    SourcePlugin('Ankara Üniv.', title='Ankara Üniversitesi Araştırma: {query}',
+                 authors='Ankara Üniversitesi Akademik', language='tr',
+                 link='https://acikarsiv.ankara.edu.tr/handle?query={q}'),
+    SourcePlugin('ScienceDirect', title='ScienceDirect: {query}', authors='Elsevier',
+                 link='https://www.sciencedirect.com/search?qs={q}'),
+    SourcePlugin('Springer', title='Springer: {query}', authors='Springer Nature',
+                 link='https://link.springer.com/search?query={q}'),
+    # JavaScript tabanlı arayüz olduğu için direkt arama yapılamıyor; siteye gidip manuel arama gerekir
+    SourcePlugin('YÖK Tez', title='YÖK Tez Ara: {query}', authors='Yükseköğretim Kurulu', language='tr',
+                 link='https://tez.yok.gov.tr/UlusalTezMerkezi/'),
+    SourcePlugin('Milli Kütüphane', title='Milli Kütüphane: {query}', authors='T.C. Kültür Bakanlığı',
+                 language='tr', link='https://www.mkutup.gov.tr/arama?q={q}')
+)
+
+_default_registry = None
+_default_registry_lock = threading.Lock()
+
+
+def default_registry():
+    """Yerleşik kaynaklar + kurulu eklentiler (ilk çağrıda bir kez yüklenir)"""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            registry = SourceRegistry(BUILTIN_SOURCES)
+            registry.load_entry_points()
+            _default_registry = registry
+        return _default_registry
+
+
 class SearchEngine:
     """Arama motoru sınıfı"""
     
-    def __init__(self):
+    # Eklentide hız sınırı belirtilmemiş ağ kaynakları için istekler arası süre (saniye)
+    DEFAULT_RATE_LIMIT = 0.2
+    
+    # API adresleri; örnek üzerinde değiştirilebilir (ör. benchmark'taki yerel sunucu)
+    DOAJ_API_URL = 'https://doaj.org/api/search/articles'
+    ARXIV_API_URL = 'http://export.arxiv.org/api/query'
+    CROSSREF_API_URL = 'https://api.crossref.org/works'
+    
+    # Yeniden denenecek HTTP durum kodları
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
+    # Crossref'ten yalnızca kullanılan alanlar istenir (select=); kaynakça
+    # listeleri ve özetler yanıttan çıkar
+    CROSSREF_FIELDS = ('DOI', 'URL', 'title', 'author', 'published-print',
+                       'published-online', 'created')
+    PAGE_PREFETCH = 2  # Kaynak başına aynı anda uçuşta olabilecek sayfa isteği
+    
+    # ArXiv Atom akışındaki XML ad alanları
+    ATOM_NS = '{http://www.w3.org/2005/Atom}'
+    ARXIV_NS = '{http://arxiv.org/schemas/atom}'
+    
+    # DergiPark arama sonuç kartlarının sınıfları; site işaretlemesi değişirse
+    # yalnızca bunların güncellenmesi yeterli. Arama adresi (?q=..&section=articles&page=N),
+    # sınıf adları ve 20'lik sayfa boyutu varsayımdır, canlı sitedeki sayfayla henüz
+    # doğrulanmadı. Kart bulunamazsa arama ayrıştırma hatası olarak kaydedilir ve
+    # arama sayfası linki döner (bkz. _fetch_dergipark_page).
+    DERGIPARK_SEARCH_URL = 'https://dergipark.org.tr/tr/search'
+    DERGIPARK_CARD_CLASS = 'article-card'
+    DERGIPARK_TITLE_CLASS = 'card-title'
+    DERGIPARK_AUTHORS_CLASS = 'article-authors'
+    DERGIPARK_DATE_CLASS = 'article-date'
+    YEAR_PATTERN = re.compile(r'\b(?:19|20)\d{2}\b')
+    
+    def __init__(self, max_workers=8, timeout=15, retries=3, backoff_factor=0.5, pool_maxsize=4,
+                 cache=None, metrics=None, registry=None):
         self.headers = {
             'User-Agent': 'AcademicSearcher/2.0',
             'Accept': 'application/json'
         }
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.pool_maxsize = pool_maxsize
+        self.cache = cache
+        self.metrics = metrics if metrics is not None else SearchMetrics()
+        self.registry = registry if registry is not None else default_registry()
+        self._local = threading.local()  # Çağrı başına ölçüm bağlamı (trace, ağ süresi)
+        self._rate_limiters = {}
+        self._rate_lock = threading.Lock()
+        self._health = {}
+        self._sessions = {}
+        self._session_lock = threading.Lock()
+    
+    def _create_session(self):
+        """Keep-alive ve yeniden deneme ayarlı oturum oluştur"""
+        # Yalnızca durum kodları (429/5xx) yeniden denenir; okuma zaman aşımı
+        # tekrarlanmaz, bağlantı hatası bir kez denenir
+        retry = SearchRetry(
+            total=self.retries,
+            connect=1,
+            read=0,
+            status=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        # pool_block: host başına bağlantı sayısı pool_maxsize ile sınırlı kalır
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=1,
+                              pool_maxsize=self.pool_maxsize, pool_block=True)
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _get_session(self, url):
+        """Host'a ait kalıcı oturumu getir (yoksa oluştur)"""
+        host = urlsplit(url).netloc
+        with self._session_lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._create_session()
+                self._sessions[host] = session
+            return session
+    
+    def _get(self, url, **kwargs):
+        """Havuzlanmış oturum üzerinden GET isteği (süre ve yanıt ölçüme yazılır)
+        
+        Zaman aşımı, çağrının bağlı olduğu kaynağın sağlık durumundan gelir ve
+        yeniden denemeler dahil isteğin toplam süre sınırıdır (bkz. SearchRetry).
+        """
+        trace = getattr(self._local, 'trace', None)
+        kwargs.setdefault('timeout', trace.timeout if trace is not None and trace.timeout else self.timeout)
+        start = time.perf_counter()
+        SearchRetry.set_deadline(time.monotonic() + kwargs['timeout'])
+        try:
+            response = self._get_session(url).get(url, **kwargs)
+        finally:
+            SearchRetry.set_deadline(None)
+            self._local.network_time = (getattr(self._local, 'network_time', 0.0)
+                                        + time.perf_counter() - start)
+        if trace is not None:
+            trace.responses.append(response)
+        return response
+    
+    @staticmethod
+    def _decode_json(response):
+        """Yanıt gövdesini doğrudan bayttan çöz (metne çevirmeden)"""
+        return json_loads(response.content)
+    
+    def close(self):
+        """Açık oturumları ve önbelleği kapat"""
+        with self._session_lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+        if self.cache is not None:
+            self.cache.close()
+    
+    def source_health(self, source):
+        """Kaynağın sağlık izleyicisini getir (yoksa oluştur)"""
+        with self._rate_lock:
+            health = self._health.get(source)
+            if health is None:
+                health = SourceHealth()
+                self._health[source] = health
+            return health
+    
+    def is_available(self, source):
+        """Kaynağın devresi kapalı mı (açık/yarı açıksa arayüzde işaretlenir)"""
+        return self.source_health(source).state == SourceHealth.CLOSED
+    
+    def diagnostics(self):
+        """Ölçümler ve kaynak sağlık durumları (JSON'a yazılabilir sözlük)"""
+        snapshot = self.metrics.snapshot()
+        with self._rate_lock:
+            health_items = list(self._health.items())
+        for source, health in health_items:
+            if source in snapshot['sources']:
+                snapshot['sources'][source]['health'] = health.to_dict(self.timeout)
+        return snapshot
+    
+    def diagnostics_json(self):
+        return json.dumps(self.diagnostics(), ensure_ascii=False, indent=2)
+    
+    def _get_rate_limiter(self, source):
+        """Kaynağın hız sınırlayıcısını getir (yoksa oluştur)"""
+        with self._rate_lock:
+            limiter = self._rate_limiters.get(source)
+            if limiter is None:
+                plugin = self.registry.get(source)
+                interval = plugin.rate_limit if plugin is not None else None
+                limiter = RateLimiter(self.DEFAULT_RATE_LIMIT if interval is None else interval)
+                self._rate_limiters[source] = limiter
+            return limiter
+    
+    def search_all(self, sources, query, max_results):
+        """Kaynakları eşzamanlı ara, (kaynak, sonuçlar) çiftlerini tamamlandıkça üret
+        
+        Yalnızca link üreten kaynaklar hemen, bu thread'de çözülür; worker
+        havuzu ve hız sınırı yalnızca ağ kaynaklarına harcanır.
+        """
+        network_sources = []
+        for source in sources:
+            plugin = self.registry.get(source)
+            if plugin is not None and not plugin.network:
+                yield source, plugin.resolve_links(query)
+            else:
+                network_sources.append(source)
+        if not network_sources:
+            return
+        
+        workers = min(self.max_workers, len(network_sources))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='search') as executor:
+            futures = {
+                executor.submit(self.search, source, query, max_results): source
+                for source in network_sources
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    results = future.result()
+                except Exception:
+                    results = []
+                yield source, results
     
     def search(self, source, query, max_results):
-        """Kaynağa göre arama yap"""
-        search_methods = {
-            'DOAJ': self._search_doaj,
-            'ArXiv': self._search_arxiv,
-            'Crossref': self._search_crossref,
-            'PubMed': self._search_pubmed,
-            'IEEE': self._search_ieee,
-            'MIT': self._search_mit,
-            'DergiPark': self._search_dergipark,
-            'TÜBİTAK': self._search_tubitak,
-            'ODTÜ': self._search_metu,
-            'İTÜ': self._search_itu,
-            'Boğaziçi': self._search_boun,
-            'Ankara Üniv.': self._search_ankara,
-            # YENİ KAYNAKLAR
-            'ScienceDirect': self._search_sciencedirect,
-            'Springer': self._search_springer,
-            'YÖK Tez': self._search_yok_tez,
-            'Milli Kütüphane': self._search_milli_kutuphane
-        }
+        """Kaynağa göre arama yap (önbellek, hız sınırı ve ölçüm ile)"""
+        plugin = self.registry.get(source)
+        if plugin is None:
+            return []
+        if not plugin.network:
+            return plugin.resolve_links(query)
+        
+        start = time.perf_counter()
+        if self.cache is not None:
+            cached = self.cache.get(source, query, max_results)
+            if cached is not None:
+                self.metrics.record(source, time.perf_counter() - start, len(cached), cached=True)
+                return cached
+        
+        health = self.source_health(source)
+        if not health.allow_request():
+            # Devre açık: kaynağı beklemeden atla, varsa eski sonuçları kullan
+            self.metrics.record(source, 0.0, skipped=True)
+            if self.cache is not None:
+                stale = self.cache.get(source, query, max_results, allow_stale=True)
+                if stale is not None:
+                    return stale
+            return []
         
-        if source in search_methods:
-            return search_methods[source](query, max_results)
-        return []
-    
-    def _search_doaj(self, query, max_results):
-        """DOAJ arama"""
+        trace = SearchCallTrace(timeout=health.timeout(self.timeout))
         try:
-            url = f'https://doaj.org/api/search/articles/{requests.utils.quote(query)}?pageSize={max_results}'
-            response = requests.get(url, headers=self.headers, timeout=15)
-            if response.status_code != 200:
-                return []
-            
-            data = response.json()
+            if plugin.paginated:
+                # Sayfalı kaynaklarda bekleme ve ayrıştırma ölçümü her sayfada yapılır
+                self._local.trace = trace
+                try:
+                    results = self._collect_pages(source, query, max_results)
+                finally:
+                    self._local.trace = None
+            else:
+                self._get_rate_limiter(source).wait()
+                results = plugin.normalize_results(
+                    self._run_traced(trace, self._plugin_callable(plugin.search), query, max_results))
+        except Exception as e:
+            trace.error = e
             results = []
-            for item in data.get('results', []):
-                bib = item.get('bibjson', {})
-                title = bib.get('title', '')
-                if isinstance(title, list):
-                    title = title[0] if title else 'No title'
-                
-                authors = ', '.join([a.get('name', '') for a in bib.get('author', [])])
-                year = bib.get('year', '') or bib.get('publication_year', '')
-                
-                # Link bul
-                link = ''
-                for l in bib.get('link', []):
-                    if l.get('url'): 
-                        link = l.get('url')
-                        break
-                if not link:
-                    link = bib.get('url', '') or item.get('id', '')
-                
-                results.append({
-                    'title': title, 'authors': authors, 'year': str(year),
-                    'source': 'DOAJ', 'link': link
-                })
-            return results
-        except Exception:
-            return []
+        
+        self.metrics.record(source, trace.latency, len(results), trace.status,
+                            trace.bytes_received, sum(trace.parse_times), trace.error)
+        if trace.failed:
+            health.record_failure()
+        else:
+            health.record_success(trace.latencies)
+        
+        if self.cache is not None:
+            # Hatalı çağrının sonuçları eksik olabilir (ör. 2. sayfada 503): önbelleğe yazılmaz
+            if results and not trace.failed:
+                self.cache.set(source, query, max_results, results)
+            elif not results:
+                # Ağ hatasında (ör. çevrimdışı) eski sonuçlar boş listeden iyidir
+                stale = self.cache.get(source, query, max_results, allow_stale=True)
+                if stale is not None:
+                    return stale
+        return results
     
-    def _search_arxiv(self, query, max_results):
-        """ArXiv arama"""
+    def _plugin_callable(self, func):
+        """Eklenti fonksiyonunu bu motora bağla (metin ise aynı adlı metot)"""
+        if isinstance(func, str):
+            return getattr(self, func)
+        return functools.partial(func, self)
+    
+    def _run_traced(self, trace, func, *args):
+        """func'ı trace'e bağlı çalıştır; ağ beklemesi dışındaki süre ayrıştırma sayılır
+        
+        Akışla okunan yanıtlarda gövdenin okunması ayrıştırmaya dahildir.
+        """
+        local = self._local
+        local.trace = trace
+        network_before = getattr(local, 'network_time', 0.0)
+        start = time.perf_counter()
         try:
-            url = f'http://export.arxiv.org/api/query?search_query=all:{requests.utils.quote(query)}&max_results={max_results}'
-            response = requests.get(url, headers=self.headers, timeout=15)
-            if response.status_code != 200:
-                return []
-            
-            soup = BeautifulSoup(response.content, 'xml')
-            results = []
-            for entry in soup.find_all('entry'):
-                title = entry.find('title')
-                title = title.text.strip() if title else 'No title'
-                
-                authors = []
-                for author in entry.find_all('author'):
-                    name = author.find('name')
-                    if name:
-                        authors.append(name.text.strip())
-                
-                published = entry.find('published')
-                year = published.text[:4] if published else ''
-                
-                link_elem = entry.find('link', {'title': 'pdf'})
-                link = link_elem['href'] if link_elem else entry.find('id').text if entry.find('id') else ''
-                
-                results.append({
-                    'title': title, 'authors': ', '.join(authors), 'year': year,
-                    'source': 'ArXiv', 'link': link
-                })
-            return results
-        except Exception:
-            return []
-    
-    def _search_crossref(self, query, max_results):
-        """Crossref arama"""
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            network = getattr(local, 'network_time', 0.0) - network_before
+            trace.call_times.append(elapsed)
+            trace.parse_times.append(max(0.0, elapsed - network))
+            local.trace = None
+    
+    def is_paginated(self, source):
+        """Kaynak sayfalı çekmeyi destekliyor mu"""
+        plugin = self.registry.get(source)
+        return plugin is not None and plugin.paginated
+    
+    def iter_pages(self, source, query, max_results, page_size=None, prefetch=None):
+        """Sayfalı kaynaktan sonuçları sayfa sayfa üret
+        
+        Her sayfa isteği kaynağın hız sınırlayıcısından geçer. Ofset tabanlı
+        kaynaklarda sonraki sayfalar önceden istenir; toplamda en fazla
+        max_results kayıt döner. Ağ/ayrıştırma hataları çağırana iletilir.
+        """
+        plugin = self.registry.get(source)
+        if plugin is None or not plugin.paginated:
+            raise ValueError(f"Sayfalı olmayan kaynak: {source}")
+        if plugin.pagination == SourcePlugin.CURSOR:
+            pages = self._iter_cursor_pages
+        else:
+            pages = self._iter_offset_pages
+        
+        page_size = max(1, min(page_size or plugin.page_size, max_results))
+        prefetch = max(1, prefetch or self.PAGE_PREFETCH)
+        fetch = self._plugin_callable(plugin.fetch_page)
+        limiter = self._get_rate_limiter(source)
+        trace = getattr(self._local, 'trace', None) or SearchCallTrace()
+        
+        def fetch_page(*args):
+            limiter.wait()
+            page = self._run_traced(trace, fetch, query, *args)
+            if plugin.pagination == SourcePlugin.CURSOR:
+                records, cursor = page
+                return plugin.normalize_results(records), cursor
+            return plugin.normalize_results(page)
+        
+        return pages(fetch_page, max_results, page_size, prefetch)
+    
+    def _iter_offset_pages(self, fetch_page, max_results, page_size, prefetch):
+        """Sayfa numarasıyla adreslenen kaynakları prefetch sayfa önden çek"""
+        page_count = -(-max_results // page_size)
+        remaining = max_results
+        futures = {}
+        executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix='page')
         try:
-            url = f'https://api.crossref.org/works?query={requests.utils.quote(query)}&rows={max_results}'
-            response = requests.get(url, headers=self.headers, timeout=15)
-            if response.status_code != 200:
-                return []
+            for index in range(min(prefetch, page_count)):
+                futures[index] = executor.submit(fetch_page, index, page_size)
             
-            data = response.json()
-            results = []
-            for item in data.get('message', {}).get('items', []):
-                title = item.get('title', [''])[0] if item.get('title') else 'No title'
+            for index in range(page_count):
+                records = futures.pop(index).result()
                 
-                authors = []
-                for author in item.get('author', []):
-                    given = author.get('given', '')
-                    family = author.get('family', '')
-                    if given or family:
-                        authors.append(f"{given} {family}".strip())
+                following = index + prefetch
+                if following < page_count and len(records) >= page_size:
+                    futures[following] = executor.submit(fetch_page, following, page_size)
                 
-                # Yıl bul
-                year = ''
-                date_parts = (item.get('published-print') or item.get('published-online') or 
-                            item.get('created', {})).get('date-parts', [[None]])[0]
-                if date_parts and date_parts[0]:
-                    year = str(date_parts[0])
+                records = records[:remaining]
+                remaining -= len(records)
+                if records:
+                    yield records
+                # Eksik sayfa sonuçların bittiğini gösterir
+                if len(records) < page_size or remaining <= 0:
+                    break
+        finally:
+            # Başlamamış sayfalar iptal edilir; uçuştakiler beklenir ki arama
+            # bittikten sonra ölçüme (trace) yazmaya devam etmesinler
+            for future in futures.values():
+                future.cancel()
+            executor.shutdown(wait=True)
+    
+    def _iter_cursor_pages(self, fetch_page, max_results, page_size, prefetch):
+        """Cursor ile ilerleyen kaynakları çek
+        
+        Sonraki istek, cursor alınır alınmaz (kayıtlar çağırana verilmeden
+        önce) gönderilir; böylece ağ beklemesi tüketimle örtüşür.
+        """
+        remaining = max_results
+        rows = min(page_size, remaining)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='page')
+        future = executor.submit(fetch_page, '*', rows)
+        try:
+            while future is not None:
+                records, next_cursor = future.result()
+                records = records[:remaining]
+                remaining -= len(records)
                 
-                link = item.get('URL', '')
+                future = None
+                if next_cursor and remaining > 0 and len(records) >= rows:
+                    rows = min(page_size, remaining)
+                    future = executor.submit(fetch_page, next_cursor, rows)
                 
-                results.append({
-                    'title': title, 'authors': ', '.join(authors), 'year': year,
-                    'source': 'Crossref', 'link': link
-                })
-            return results
-        except Exception:
-            return []
+                if records:
+                    yield records
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=True)
     
-    def _search_pubmed(self, query, max_results):
-        """PubMed arama"""
+    def _collect_pages(self, source, query, max_results):
+        """Tüm sayfaları tek listede topla; hata olursa o ana kadar gelenleri döndür"""
+        results = []
         try:
-            # Basitleştirilmiş PubMed arama
-            return [{
-                'title': f'PubMed: {query}',
-                'authors': 'NCBI',
-                'year': datetime.now().year,
-                'source': 'PubMed',
-                'link': f'https://pubmed.ncbi.nlm.nih.gov/?term={requests.utils.quote(query)}'
-            }]
-        except Exception:
-            return []
+            for records in self.iter_pages(source, query, max_results):
+                results.extend(records)
+        except Exception as e:
+            trace = getattr(self._local, 'trace', None)
+            if trace is not None:
+                trace.error = e
+        return results
     
-    def _search_ieee(self, query, max_results):
-        """IEEE arama"""
-        return [{
-            'title': f'IEEE Xplore: {query}',
-            'authors': 'IEEE',
-            'year': datetime.now().year,
-            'source': 'IEEE',
-            'link': f'https://ieeexplore.ieee.org/search/searchresult.jsp?newsearch=true&queryText={requests.utils.quote(query)}'
-        }]
-    
-    def _search_mit(self, query, max_results):
-        """MIT Libraries Search"""
-        try:
-            # MIT Libraries genel arama
-            return [{
-                'title': f'MIT Libraries: {query}',
-                'authors': 'MIT Libraries',
-                'year': str(datetime.now().year),
-                'source': 'MIT',
-                'link': f'https://libraries.mit.edu/search/?q={requests.utils.quote(query)}'
-            }]
-        except Exception:
+    def _fetch_doaj_page(self, query, index, page_size):
+        """DOAJ sonuç sayfası (index 0'dan başlar, API'de page 1'den)"""
+        url = (f'{self.DOAJ_API_URL}/{requests.utils.quote(query)}'
+               f'?page={index + 1}&pageSize={page_size}')
+        response = self._get(url)
+        if response.status_code != 200:
             return []
+        return self._parse_doaj_page(self._decode_json(response))
+    
+    def _parse_doaj_page(self, data):
+        """Çözülmüş DOAJ yanıtından kayıtları çıkar"""
+        results = []
+        for item in data.get('results', []):
+            bib = item.get('bibjson', {})
+            title = bib.get('title', '')
+            if isinstance(title, list):
+                title = title[0] if title else 'No title'
+            
+            authors = ', '.join([a.get('name', '') for a in bib.get('author', [])])
+            year = bib.get('year', '') or bib.get('publication_year', '')
+            
+            # Link bul
+            link = ''
+            for l in bib.get('link', []):
+                if l.get('url'): 
+                    link = l.get('url')
+                    break
+            if not link:
+                link = bib.get('url', '') or item.get('id', '')
+            
+            doi = next((i.get('id', '') for i in bib.get('identifier', [])
+                        if str(i.get('type', '')).lower() == 'doi'), '')
+            
+            results.append(SearchResult(title, authors, year, 'DOAJ', link, doi))
+        return results
     
-    def _search_dergipark(self, query, max_results):
-        """DergiPark arama"""
-        try:
-            url = f'https://dergipark.org.tr/tr/search/{requests.utils.quote(query)}'
-            headers = {'User-Agent': 'AcademicSearcher/2.0'}
-            response = requests.get(url, headers=headers, timeout=15)
+    def _fetch_arxiv_page(self, query, index, page_size):
+        """ArXiv sonuç sayfası (start = index * page_size)"""
+        url = (f'{self.ARXIV_API_URL}?search_query=all:{requests.utils.quote(query)}'
+               f'&start={index * page_size}&max_results={page_size}')
+        with self._get(url, stream=True) as response:
             if response.status_code != 200:
                 return []
+            response.raw.decode_content = True  # gzip açılmış akış
+            return list(self._parse_arxiv_feed(response.raw))
+    
+    def _parse_arxiv_feed(self, stream):
+        """Atom akışını lxml iterparse ile okuyup kayıtları geldikçe üret
+        
+        Tamamlanan <entry> öğeleri ve önceki kardeşleri silinir; bellek
+        kullanımı sonuç sayısından bağımsız kalır.
+        """
+        from lxml import etree
+        
+        atom = self.ATOM_NS
+        for _, entry in etree.iterparse(stream, events=('end',), tag=atom + 'entry'):
+            title = entry.findtext(atom + 'title')
+            title = title.strip() if title else 'No title'
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            results = []
+            authors = []
+            for name in entry.iterfind(f'{atom}author/{atom}name'):
+                if name.text:
+                    authors.append(name.text.strip())
+            
+            published = entry.findtext(atom + 'published') or ''
+            entry_id = (entry.findtext(atom + 'id') or '').strip()
+            
+            link = entry_id
+            for link_elem in entry.iterfind(atom + 'link'):
+                if link_elem.get('title') == 'pdf':
+                    link = link_elem.get('href', entry_id)
+                    break
+            
+            doi = entry.findtext(self.ARXIV_NS + 'doi') or ''
             
-            # Basitleştirilmiş arama
-            return [{
-                'title': f'DergiPark: {query}',
-                'authors': 'Türk Akademik',
-                'year': datetime.now().year,
-                'source': 'DergiPark',
-                'link': url
-            }]
-        except Exception:
+            yield SearchResult(title, ', '.join(authors), published[:4], 'ArXiv', link,
+                               doi.strip(), ResultDeduplicator.arxiv_id_from_url(entry_id))
+            
+            # İşlenen öğeyi ve öncekileri bellekten at
+            entry.clear()
+            parent = entry.getparent()
+            while entry.getprevious() is not None:
+                del parent[0]
+    
+    def _fetch_crossref_page(self, query, cursor, rows):
+        """Crossref derin sayfalama: (kayıtlar, sonraki cursor) döndürür"""
+        url = (f'{self.CROSSREF_API_URL}?query={requests.utils.quote(query)}'
+               f'&rows={rows}&cursor={requests.utils.quote(cursor)}'
+               f'&select={",".join(self.CROSSREF_FIELDS)}')
+        response = self._get(url)
+        if response.status_code != 200:
+            return [], None
+        return self._parse_crossref_page(self._decode_json(response))
+    
+    def _parse_crossref_page(self, data):
+        """Çözülmüş Crossref yanıtından (kayıtlar, sonraki cursor) çıkar"""
+        message = data.get('message', {})
+        results = []
+        for item in message.get('items', []):
+            title = item.get('title', [''])[0] if item.get('title') else 'No title'
+            
+            authors = []
+            for author in item.get('author', []):
+                given = author.get('given', '')
+                family = author.get('family', '')
+                if given or family:
+                    authors.append(f"{given} {family}".strip())
+            
+            # Yıl bul
+            year = 0
+            date_parts = (item.get('published-print') or item.get('published-online') or 
+                          item.get('created', {})).get('date-parts', [[None]])[0]
+            if date_parts and date_parts[0]:
+                year = date_parts[0]
+            
+            link = item.get('URL', '')
+            
+            results.append(SearchResult(title, ', '.join(authors), year, 'Crossref', link,
+                                        item.get('DOI', '')))
+        return results, message.get('next-cursor')
+    
+    def _fetch_dergipark_page(self, query, index, page_size):
+        """DergiPark makale arama sayfası (index 0'dan başlar, sitede page 1'den)
+        
+        Sayfa boyutunu site belirler; page_size yalnızca sayfalamanın bitişini
+        anlamak için kullanılır. İlk sayfa 200 döndüğü halde hiç sonuç kartı
+        içermiyorsa işaretleme değişmiş sayılır: SourceParseError trace'e yazılır
+        (kaynak sağlığı ve ölçümler hatayı görür) ve arama sayfası linki döner.
+        """
+        search_url = f'{self.DERGIPARK_SEARCH_URL}?q={requests.utils.quote(query)}&section=articles'
+        url = f'{search_url}&page={index + 1}'
+        response = self._get(url, headers={'Accept': 'text/html'})
+        if response.status_code != 200:
             return []
+        results = self._parse_dergipark_page(response.content, response.url or url,
+                                             response.encoding or 'utf-8')
+        if not results and index == 0:
+            trace = getattr(self._local, 'trace', None)
+            if trace is not None:
+                trace.error = SourceParseError(f"DergiPark sayfasında sonuç kartı yok: {url}")
+            return [SearchResult(f'DergiPark: {query}', 'Türk Akademik', datetime.now().year,
+                                 'DergiPark', search_url)]
+        return results
     
-    def _search_tubitak(self, query, max_results):
-        """TÜBİTAK arama"""
-        return [{
-            'title': f'TÜBİTAK: {query}',
-            'authors': 'ULAKBİM',
-            'year': datetime.now().year,
-            'source': 'TÜBİTAK',
-            'link': f'https://uvt.ulakbim.gov.tr/uvt/index.php?cwid=2&vtadi=TPRJ&query={requests.utils.quote(query)}'
-        }]
-    
-    def _search_metu(self, query, max_results):
-        """ODTÜ arama"""
-        return [{
-            'title': f'ODTÜ: {query}',
-            'authors': 'ODTÜ Akademik',
-            'year': datetime.now().year,
-            'source': 'ODTÜ',
-            'link': f'https://dspace.metu.edu.tr/handle/11511?query={requests.utils.quote(query)}'
-        }]
-    
-    def _search_itu(self, query, max_results):
-        """İTÜ arama"""
-        return [{
-            'title': f'İTÜ: {query}',
-            'authors': 'İTÜ Akademik',
-            'year': datetime.now().year,
-            'source': 'İTÜ',
-            'link': f'https://acikarsiv.itu.edu.tr/handle?query={requests.utils.quote(query)}'
-        }]
-    
-    def _search_boun(self, query, max_results):
-        """Boğaziçi arama"""
-        return [{
-            'title': f'Boğaziçi: {query}',
-            'authors': 'Boğaziçi Üniversitesi',
-            'year': datetime.now().year,
-            'source': 'Boğaziçi',
-            'link': f'https://openaccess.boun.edu.tr/handle?query={requests.utils.quote(query)}'
-        }]
-    
-    def _search_ankara(self, query, max_results):
-        """Ankara Üniversitesi arama"""
-        try:
-            # Ankara Üniversitesi akademik portalı
-            return [{
-                'title': f'Ankara Üniversitesi Araştırma: {query}',
-                'authors': 'Ankara Üniversitesi Akademik',
-                'year': str(datetime.now().year),  # String olarak döndür
-                'source': 'Ankara Üniv.',
-                'link': f'https://acikarsiv.ankara.edu.tr/handle?query={requests.utils.quote(query)}'
-            }]
-        except Exception:
-            return []
-
-    def _search_sciencedirect(self, query, max_results):
-        """ScienceDirect (Elsevier) arama"""
-        try:
-            # ScienceDirect genel arama linki - API key gerektirmeden
-            return [{
-                'title': f'ScienceDirect: {query}',
-                'authors': 'Elsevier',
-                'year': str(datetime.now().year),
-                'source': 'ScienceDirect', 
-                'link': f'https://www.sciencedirect.com/search?qs={requests.utils.quote(query)}'
-            }]
-        except Exception:
-            return []
+    def _parse_dergipark_page(self, content, base_url=DERGIPARK_SEARCH_URL, encoding='utf-8'):
+        """Arama sayfasından yalnızca sonuç kartlarını okuyarak kayıt çıkar
+        
+        Sayfa lxml.html ile (C ayrıştırıcı) okunur; Python tarafında yalnızca
+        sonuç kartlarının alt ağaçlarına dokunulur. Gezinme, filtre ve betik
+        blokları için nesne oluşturulmaz. Baytlar encoding ile çözülür; lxml
+        meta charset olmayan sayfayı latin-1 sayıp Türkçe harfleri bozar.
+        """
+        from lxml import html
+        
+        document = html.document_fromstring(content, parser=html.HTMLParser(encoding=encoding))
+        results = []
+        for card in document.find_class(self.DERGIPARK_CARD_CLASS):
+            heading = next(iter(card.find_class(self.DERGIPARK_TITLE_CLASS)), card)
+            anchor = heading.find('.//a[@href]')
+            if anchor is None:
+                continue
+            title = ' '.join(anchor.text_content().split()) or 'No title'
             
-    def _search_springer(self, query, max_results):
-        """Springer Link arama"""
-        try:
-            # Springer Link genel arama
-            return [{
-                'title': f'Springer: {query}',
-                'authors': 'Springer Nature',
-                'year': str(datetime.now().year),
-                'source': 'Springer',
-                'link': f'https://link.springer.com/search?query={requests.utils.quote(query)}'
-            }]
-        except Exception:
-            return []
+            authors_block = next(iter(card.find_class(self.DERGIPARK_AUTHORS_CLASS)), None)
+            authors = ' '.join(authors_block.text_content().split()) if authors_block is not None else ''
             
-    def _search_yok_tez(self, query, max_results):
-        """YÖK Tez Merkezi arama"""
-        try:
-            # YÖK Tez için genel bilgilendirme linki
-            # JavaScript tabanlı arayüz olduğu için direkt arama yapılamıyor
-            return [{
-                'title': f'YÖK Tez Ara: {query}',
-                'authors': 'Yükseköğretim Kurulu',
-                'year': str(datetime.now().year),
-                'source': 'YÖK Tez',
-                'link': 'https://tez.yok.gov.tr/UlusalTezMerkezi/',
-                'note': 'Siteye gidip manuel arama yapmanız gerekiyor'
-            }]
-        except Exception:
-            return []
+            # Yıl yalnızca tarih öğesinden okunur; cilt, sayı ve ISSN numaraları yıl sanılmasın
+            date = next(iter(card.find_class(self.DERGIPARK_DATE_CLASS)), None)
+            match = None
+            if date is not None:
+                match = self.YEAR_PATTERN.search(date.get('datetime') or date.text_content())
             
-    def _search_milli_kutuphane(self, query, max_results):
-        """Milli Kütüphane arama"""
-        try:
-            # Milli Kütüphane katalog tarama
-            return [{
-                'title': f'Milli Kütüphane: {query}',
-                'authors': 'T.C. Kültür Bakanlığı',
-                'year': str(datetime.now().year),
-                'source': 'Milli Kütüphane',
-                'link': f'https://www.mkutup.gov.tr/arama?q={requests.utils.quote(query)}'
-            }]
-        except Exception:
-            return []
+            doi = ''
+            for link in card.iterfind('.//a[@href]'):
+                href = link.get('href')
+                if 'doi.org/' in href:
+                    doi = ResultDeduplicator.normalize_doi(href)
+                    break
+            
+            results.append(SearchResult(title, authors, int(match.group()) if match else 0,
+                                        'DergiPark', urljoin(base_url, anchor.get('href')), doi))
+        return results
+
+
+class SummaryCancelled(Exception):
+    """Özet işi iptal edildi (cancel olayı kurulmuş)"""
+
 
 class SummaryEngine:
-    """Özet çıkarma motoru"""
+    """Özet çıkarma motoru
     
-    def __init__(self):
+    Tokenizer ve özetleyici nesneleri dil başına bir kez oluşturulup tekrar
+    kullanılır. Sonuçlar metin özetine (SHA-256) göre LRU önbellekte tutulur;
+    db verilirse not veritabanına da yazılır ve yeniden başlatmadan sonra korunur.
+    """
+    
+    ALGORITHMS = ['lsa', 'textrank', 'tfidf', 'key_sentences']
+    
+    THESIS_INDICATORS = [
+        'bu çalışmada', 'amacımız', 'hipotezimiz', 'tezimiz', 'sonuç olarak',
+        'bulgularımız', 'kanıtlamaktadır', 'göstermektedir', 'öneriyoruz',
+        'this study', 'we propose', 'our hypothesis', 'we demonstrate',
+        'results show', 'we conclude', 'contributes to'
+    ]
+    # Tüm göstergeler tek bir derlenmiş desende: cümle başına tek tarama
+    THESIS_PATTERN = re.compile('|'.join(re.escape(i) for i in THESIS_INDICATORS), re.IGNORECASE)
+    MAX_THESES = 7
+    
+    WORD_PATTERN = re.compile(r'\w+')
+    
+    def __init__(self, db=None, cache_size=256):
         self.supported_languages = ['english', 'turkish']
+        self.db = db
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._tokenizers = {}
+        self._summarizers = {}
+        self._instances_lock = threading.Lock()
+    
+    @staticmethod
+    def content_hash(text):
+        """Önbellek anahtarı için metin özeti"""
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    
+    def _memoized(self, kind, text, compute):
+        """Sonucu önbellekten getir, yoksa hesaplayıp kaydet"""
+        key = (self.content_hash(text), kind)
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return self._cache[key]
+        
+        result = self.db.get_cached_summary(*key) if self.db is not None else None
+        if result is None:
+            self.cache_misses += 1
+            result = compute()
+            if self.db is not None:
+                self.db.save_cached_summary(key[0], kind, result)
+        else:
+            self.cache_hits += 1
+        
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+    
+    def _get_tokenizer(self, language):
+        """Dilin hazır tokenizer'ını getir"""
+        with self._instances_lock:
+            tokenizer = self._tokenizers.get(language)
+            if tokenizer is None:
+                tokenizer = load_summary_stack().Tokenizer(language)
+                self._tokenizers[language] = tokenizer
+            return tokenizer
+    
+    def _get_summarizer(self, algorithm, language):
+        """Algoritma ve dil için hazır özetleyiciyi getir"""
+        key = (algorithm, language)
+        with self._instances_lock:
+            summarizer = self._summarizers.get(key)
+            if summarizer is None:
+                stack = load_summary_stack()
+                if algorithm == 'lsa':
+                    summarizer = stack.LsaSummarizer()
+                else:  # textrank
+                    summarizer = stack.TextRankSummarizer()
+                self._summarizers[key] = summarizer
+            return summarizer
+    
+    def warm_up(self):
+        """Özetleme kütüphanelerini arka planda önceden yükle"""
+        if not SUMMARY_AVAILABLE:
+            return
+        
+        def load():
+            try:
+                load_summary_stack()
+            except Exception:
+                pass  # Hata ilk özetleme denemesinde kullanıcıya gösterilir
+        
+        threading.Thread(target=load, daemon=True).start()
+    
+    @staticmethod
+    def _check_cancelled(cancel):
+        """cancel (threading.Event) kurulduysa SummaryCancelled fırlat"""
+        if cancel is not None and cancel.is_set():
+            raise SummaryCancelled()
     
-    def summarize(self, text, algorithm='lsa', sentences_count=5):
-        """Metni özetle"""
+    def summarize(self, text, algorithm='lsa', sentences_count=5, cancel=None):
+        """Metni özetle
+        
+        cancel verilirse aşama aralarında (tokenizasyon ile özetleme arası gibi)
+        denetlenir; kurulmuşsa SummaryCancelled fırlatılır ve sonuç önbelleğe yazılmaz.
+        """
         try:
-            language = 'turkish' if self._is_turkish(text) else 'english'
-            
-            if algorithm == 'key_sentences':
-                return self._extract_key_sentences(text, sentences_count)
-            else:
-                return self._algorithmic_summary(text, sentences_count, algorithm, language)
+            return self._memoized(f'summary:{algorithm}:{sentences_count}', text,
+                                  lambda: self._summarize(text, algorithm, sentences_count, cancel))
+        except SummaryCancelled:
+            raise
         except Exception as e:
             return f"Özetleme hatası: {str(e)}"
     
-    def _algorithmic_summary(self, text, sentences_count, algorithm, language):
-        """Algoritmik özet"""
-        parser = PlaintextParser.from_string(text, Tokenizer(language))
+    def _summarize(self, text, algorithm, sentences_count, cancel=None):
+        """Önbelleksiz özet"""
+        language = 'turkish' if self._is_turkish(text) else 'english'
         
-        if algorithm == 'lsa':
-            summarizer = LsaSummarizer()
-        else:  # textrank
-            summarizer = TextRankSummarizer()
+        if algorithm == 'key_sentences':
+            return self._extract_key_sentences(text, sentences_count, cancel)
+        elif algorithm == 'tfidf':
+            return self._tfidf_summary(text, sentences_count, cancel)
+        else:
+            return self._algorithmic_summary(text, sentences_count, algorithm, language, cancel)
+    
+    def _algorithmic_summary(self, text, sentences_count, algorithm, language, cancel=None):
+        """Algoritmik özet"""
+        stack = load_summary_stack()
+        self._check_cancelled(cancel)
+        parser = stack.PlaintextParser.from_string(text, self._get_tokenizer(language))
+        summarizer = self._get_summarizer(algorithm, language)
+        # LSA/TextRank bölünemez; pahalı adıma girmeden önce son denetim
+        self._check_cancelled(cancel)
         
         summary_sentences = summarizer(parser.document, sentences_count)
         return "\n".join([str(sentence) for sentence in summary_sentences])
     
-    def _extract_key_sentences(self, text, sentences_count):
+    def _extract_key_sentences(self, text, sentences_count, cancel=None):
         """Anahtar cümleleri çıkar"""
-        sentences = nltk.sent_tokenize(text)
+        sentences = load_summary_stack().nltk.sent_tokenize(text)
+        self._check_cancelled(cancel)
         if not sentences:
             return "Özet çıkarılamadı"
         
@@ -500,34 +2210,81 @@ class SummaryEngine:
         if len(sentences) > 1:
             selected.append(sentences[-1])  # Son cümle
         
-        # En uzun cümleler
+        # En uzun cümleler (heap ile ilk k; tüm listeyi sıralamaya gerek yok)
         remaining = sentences_count - len(selected)
         if remaining > 0:
-            long_sentences = sorted(sentences[1:-1], key=len, reverse=True)[:remaining]
-            selected.extend(long_sentences)
+            selected.extend(heapq.nlargest(remaining, sentences[1:-1], key=len))
         
         return "\n".join(selected[:sentences_count])
     
-    def extract_theses(self, text):
-        """Temel tezleri çıkar"""
-        sentences = nltk.sent_tokenize(text)
-        thesis_indicators = [
-            'bu çalışmada', 'amacımız', 'hipotezimiz', 'tezimiz', 'sonuç olarak',
-            'bulgularımız', 'kanıtlamaktadır', 'göstermektedir', 'öneriyoruz',
-            'this study', 'we propose', 'our hypothesis', 'we demonstrate',
-            'results show', 'we conclude', 'contributes to'
-        ]
+    def _tfidf_summary(self, text, sentences_count, cancel=None):
+        """NumPy ile TF-IDF cümle puanlama (çok uzun metinlerde LSA'dan hızlı)
+        
+        Her cümle, belgenin TF-IDF ağırlık merkezine kosinüs benzerliğiyle
+        puanlanır. Terim-cümle matrisi yoğun kurulmaz; (cümle, terim) çiftleri
+        üzerinde bincount ile toplam token sayısına doğrusal çalışır.
+        """
+        import numpy as np
+        
+        sentences = load_summary_stack().nltk.sent_tokenize(text)
+        self._check_cancelled(cancel)
+        if len(sentences) <= sentences_count:
+            return "\n".join(sentences)
+        
+        vocabulary = {}
+        sentence_ids = []
+        term_ids = []
+        for index, sentence in enumerate(sentences):
+            for word in self.WORD_PATTERN.findall(sentence.lower()):
+                sentence_ids.append(index)
+                term_ids.append(vocabulary.setdefault(word, len(vocabulary)))
+        if not term_ids:
+            return "\n".join(sentences[:sentences_count])
+        self._check_cancelled(cancel)
+        
+        sentence_count = len(sentences)
+        term_count = len(vocabulary)
+        
+        # (cümle, terim) çiftlerini tekilleştir -> terim frekansları
+        pairs, counts = np.unique(np.asarray(sentence_ids, dtype=np.int64) * term_count +
+                                  np.asarray(term_ids, dtype=np.int64), return_counts=True)
+        rows = pairs // term_count
+        cols = pairs % term_count
+        
+        lengths = np.bincount(rows, weights=counts, minlength=sentence_count)
+        document_frequency = np.bincount(cols, minlength=term_count)
+        idf = np.log(sentence_count / document_frequency) + 1.0
+        weights = counts / lengths[rows] * idf[cols]
+        
+        centroid = np.bincount(cols, weights=weights, minlength=term_count)
+        dots = np.bincount(rows, weights=weights * centroid[cols], minlength=sentence_count)
+        norms = np.sqrt(np.bincount(rows, weights=weights ** 2, minlength=sentence_count))
+        scores = np.divide(dots, norms, out=np.zeros(sentence_count), where=norms > 0)
+        
+        # En yüksek puanlı k cümle, metindeki sırasıyla
+        top = np.argpartition(-scores, sentences_count - 1)[:sentences_count]
+        return "\n".join(sentences[i] for i in sorted(top.tolist()))
+    
+    def extract_theses(self, text, cancel=None):
+        """Temel tezleri çıkar (cancel için bkz. summarize)"""
+        return self._memoized('theses', text, lambda: self._extract_theses(text, cancel))
+    
+    def _extract_theses(self, text, cancel=None):
+        """Önbelleksiz tez çıkarma"""
+        sentences = load_summary_stack().nltk.sent_tokenize(text)
+        self._check_cancelled(cancel)
         
         thesis_sentences = []
         for sentence in sentences:
-            lower_sentence = sentence.lower()
-            if any(indicator in lower_sentence for indicator in thesis_indicators) and len(sentence) > 20:
+            if len(sentence) > 20 and self.THESIS_PATTERN.search(sentence):
                 thesis_sentences.append(sentence)
+                if len(thesis_sentences) >= self.MAX_THESES:
+                    break  # Daha fazlası gösterilmiyor
         
         if len(thesis_sentences) < 3:
             thesis_sentences = sentences[:5]
         
-        return "\n".join([f"• {thesis}" for thesis in thesis_sentences[:7]])
+        return "\n".join([f"• {thesis}" for thesis in thesis_sentences[:self.MAX_THESES]])
     
     def _is_turkish(self, text):
         """Metnin Türkçe olup olmadığını kontrol et"""
@@ -536,17 +2293,311 @@ class SummaryEngine:
         return any(char in turkish_chars for char in sample)
 
 
+# Süreç başına tek özet motoru (BatchSummarizer işçileri için)
+_worker_summary_engine = None
+
+
+def _summarize_note_worker(task):
+    """İşçi süreçte tek notu özetle - (note_id, özet, hata) döndürür"""
+    global _worker_summary_engine
+    note_id, content, algorithm, sentences_count = task
+    if _worker_summary_engine is None:
+        _worker_summary_engine = SummaryEngine()
+    try:
+        return note_id, _worker_summary_engine._summarize(content, algorithm, sentences_count), None
+    except Exception as e:
+        return note_id, None, str(e)
+
+
+class BatchSummarizer:
+    """Çok sayıda notu süreç havuzunda paralel özetleyip veritabanına yazar
+    
+    LSA'nın SVD adımı CPU'ya bağlı olduğundan thread yerine süreç kullanılır.
+    Tk ile birlikte güvenli olması için süreçler 'spawn' ile başlatılır.
+    """
+    
+    MIN_CONTENT_LENGTH = 100  # Arayüzdeki sınırla aynı
+    
+    def __init__(self, db, algorithm='lsa', sentences_count=5, max_workers=None,
+                 chunksize=8, commit_every=100):
+        self.db = db
+        self.algorithm = algorithm
+        self.sentences_count = sentences_count
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.commit_every = commit_every
+        self.cancel_event = threading.Event()
+    
+    def cancel(self):
+        """Çalışan toplu işi durdur (bekleyen notlar atlanır)"""
+        self.cancel_event.set()
+    
+    def run(self, notes, progress_callback=None):
+        """Notları özetle; progress_callback(tamamlanan, toplam) ile ilerleme bildir
+        
+        Dönüş: (başarılı, hatalı) sayıları
+        """
+        tasks = [(note['id'], note['content'], self.algorithm, self.sentences_count)
+                 for note in notes if len(note.get('content') or '') >= self.MIN_CONTENT_LENGTH]
+        total = len(tasks)
+        done = failed = 0
+        pending = []
+        if progress_callback:
+            progress_callback(0, total)
+        if not tasks:
+            return 0, 0
+        
+        # Görevler parti parti gönderilir; iptalde en fazla bir parti beklenir
+        batch_size = self.max_workers * self.chunksize
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, total), mp_context=context) as executor:
+            try:
+                for start in range(0, total, batch_size):
+                    if self.cancel_event.is_set():
+                        break
+                    batch = tasks[start:start + batch_size]
+                    for note_id, summary, error in executor.map(_summarize_note_worker, batch,
+                                                                chunksize=self.chunksize):
+                        if error is None:
+                            pending.append((note_id, summary))
+                        else:
+                            failed += 1
+                        done += 1
+                        
+                        if len(pending) >= self.commit_every:
+                            self.db.update_note_summaries(pending)
+                            pending = []
+                        if progress_callback:
+                            progress_callback(done, total)
+            finally:
+                if pending:
+                    self.db.update_note_summaries(pending)
+        
+        return done - failed, failed
+
+
+class LazyTreeLoader:
+    """Treeview satırlarını tembel ve parça parça ekleyen yardımcı
+    
+    Tüm veri bellekte tutulur; Treeview'a yalnızca görünür alan ile altındaki
+    önbellek kadar satır eklenir. Ekleme, GUI donmasın diye after() ile
+    CHUNK_SIZE'lık dilimler halinde yapılır; kaydırdıkça yeni satırlar eklenir.
+    """
+    
+    CHUNK_SIZE = 100       # Bir after() diliminde eklenecek satır
+    INITIAL_ROWS = 200     # İlk gösterimde eklenecek satır
+    PREFETCH_ROWS = 200    # Görünür alanın altında hazır tutulacak satır
+    
+    def __init__(self, tree, row_values, scrollbar=None, on_end_reached=None):
+        self.tree = tree
+        self.row_values = row_values
+        self.scrollbar = scrollbar
+        self.on_end_reached = on_end_reached
+        self.items = []
+        self.materialized = 0
+        self._iids = []
+        self._item_iids = {}
+        self._row_items = {}  # Ayrılmış satırların kayıtları yaşasın (id yeniden kullanılmasın)
+        self._next_iid = 0
+        self._visible_rows = 0
+        self._job = None
+        self.tree.configure(yscrollcommand=self._on_scroll)
+    
+    def clear(self):
+        """Tüm satırları kaldır (ayrılmış/detach edilmiş olanlar dahil)"""
+        self._cancel()
+        self.tree.delete(*self.tree.get_children())
+        detached = set(self._item_iids.values()).difference(self._iids)
+        if detached:
+            self.tree.delete(*detached)
+        self.items = []
+        self.materialized = 0
+        self._iids = []
+        self._item_iids = {}
+        self._row_items = {}
+        self._visible_rows = 0
+    
+    def set_items(self, items):
+        """Listeyi verilen satırlarla değiştir"""
+        self.clear()
+        self.items = list(items)
+        self._schedule()
+    
+    def extend(self, items):
+        """Listenin sonuna satır ekle"""
+        self.items.extend(items)
+        self._schedule()
+    
+    def insert(self, index, item):
+        """Verilen konuma satır ekle (görünür bölgedeyse hemen çiz)"""
+        self.items.insert(index, item)
+        if index < self.materialized:
+            self._insert_row(index, item)
+            # Görünür bölgenin dışına taşan son satırı geri al
+            if self.materialized > self._target():
+                self.tree.detach(self._iids.pop())
+                self.materialized -= 1
+        else:
+            self._schedule()
+    
+    def remove(self, item):
+        """Satırı listeden çıkar"""
+        index = next((i for i, existing in enumerate(self.items) if existing is item), None)
+        if index is None:
+            return
+        del self.items[index]
+        if index < self.materialized:
+            del self._iids[index]
+            self.materialized -= 1
+        iid = self._item_iids.pop(id(item), None)
+        if iid is not None:
+            del self._row_items[iid]
+            self.tree.delete(iid)
+        self._schedule()
+    
+    def reorder(self, items):
+        """Listeyi yeni sıra/alt kümeyle değiştir; yalnızca değişen satırlara dokun
+        
+        Daha önce çizilmiş satırlar yeniden oluşturulmaz: görünümden çıkanlar
+        detach edilir, yeri değişenler move ile taşınır. Eski sıralarını
+        koruyan en uzun satır dizisine hiç dokunulmaz. Yeniden bağlanan satırın
+        değerleri tazelenir; kayıt ayrılmışken değişmiş olabilir (ör. birleşme).
+        """
+        self._cancel()
+        self.items = list(items)
+        
+        count = min(len(self.items), max(self.materialized, self.INITIAL_ROWS))
+        head = self.items[:count]
+        wanted = [self._item_iids.get(id(item)) for item in head]
+        
+        attached = {iid: position for position, iid in enumerate(self._iids)}
+        wanted_set = set(wanted)
+        stable = self._stable_rows([(attached[iid], iid) for iid in wanted if iid in attached])
+        leaving = [iid for iid in self._iids if iid not in wanted_set or iid not in stable]
+        if leaving:
+            self.tree.detach(*leaving)
+        
+        for index, (item, iid) in enumerate(zip(head, wanted)):
+            if iid is None:
+                iid = f'row{self._next_iid}'
+                self._next_iid += 1
+                self.tree.insert('', index, iid=iid, values=self.row_values(item))
+                self._item_iids[id(item)] = iid
+                self._row_items[iid] = item
+            elif iid not in stable:
+                if iid not in attached:
+                    self.tree.item(iid, values=self.row_values(item))
+                self.tree.move(iid, '', index)
+        
+        self._iids = [self._item_iids[id(item)] for item in head]
+        self.materialized = count
+        self._schedule()
+    
+    @staticmethod
+    def _stable_rows(positions):
+        """(eski_konum, iid) dizisinde eski sırayı koruyan en uzun alt dizinin iid'leri"""
+        tails = []       # tails[k]: uzunluğu k+1 olan dizilerin en küçük son konumu
+        tail_indices = []
+        previous = [None] * len(positions)
+        for index, (position, _) in enumerate(positions):
+            k = bisect.bisect_left(tails, position)
+            if k == len(tails):
+                tails.append(position)
+                tail_indices.append(index)
+            else:
+                tails[k] = position
+                tail_indices[k] = index
+            previous[index] = tail_indices[k - 1] if k else None
+        
+        stable = set()
+        index = tail_indices[-1] if tail_indices else None
+        while index is not None:
+            stable.add(positions[index][1])
+            index = previous[index]
+        return stable
+    
+    def _insert_row(self, index, item):
+        iid = self._item_iids.get(id(item))
+        if iid is None:
+            iid = f'row{self._next_iid}'
+            self._next_iid += 1
+            self.tree.insert('', index, iid=iid, values=self.row_values(item))
+            self._item_iids[id(item)] = iid
+            self._row_items[iid] = item
+        else:
+            # Daha önce çizilip ayrılmış satırı güncel değerleriyle yeniden bağla
+            self.tree.item(iid, values=self.row_values(item))
+            self.tree.move(iid, '', index)
+        self._iids.insert(index, iid)
+        self.materialized += 1
+    
+    def refresh(self, item):
+        """Değişen satırın görünen değerlerini güncelle"""
+        iid = self._item_iids.get(id(item))
+        if iid is not None:
+            self.tree.item(iid, values=self.row_values(item))
+    
+    def _target(self):
+        """Şu an Treeview'da bulunması gereken satır sayısı"""
+        return min(len(self.items), max(self.INITIAL_ROWS, self._visible_rows + self.PREFETCH_ROWS))
+    
+    def _schedule(self):
+        if self._job is None and self.materialized < self._target():
+            self._job = self.tree.after(1, self._fill_chunk)
+    
+    def _cancel(self):
+        if self._job is not None:
+            self.tree.after_cancel(self._job)
+            self._job = None
+    
+    def _fill_chunk(self):
+        """Bir dilim satırı Treeview'a ekle"""
+        self._job = None
+        end = min(self._target(), self.materialized + self.CHUNK_SIZE)
+        for item in self.items[self.materialized:end]:
+            self._insert_row(self.materialized, item)
+        self._schedule()
+    
+    def _on_scroll(self, first, last):
+        """Kaydırma konumunu izle, gerekirse yeni satır ekle"""
+        if self.scrollbar is not None:
+            self.scrollbar.set(first, last)
+        self._visible_rows = int(self.materialized * float(last))
+        self._schedule()
+        if (float(last) >= 1.0 and self.materialized >= len(self.items)
+                and self.on_end_reached is not None):
+            self.on_end_reached()
+
+
 class AcademicSearcherPro:
     """Ana uygulama sınıfı"""
     
+    RESULT_POLL_MS = 50  # Sonuç kuyruğu kontrol aralığı
+    RESULT_VIEW_DELAY_MS = 150  # Filtre/sıralama değişikliğini uygulamadan önce bekleme
+    NOTE_COLUMNS = ('id', 'title', 'source', 'authors', 'date')
+    NOTES_PAGE_SIZE = 100
+    SUMMARY_WARMUP_DELAY_MS = 1500
+    SUMMARY_TIMEOUT_MS = 60000  # Tek özet işi için üst süre
+    DIAGNOSTICS_REFRESH_MS = 1000
+    # Tanılama penceresi sütunları: (ad, başlık, genişlik)
+    DIAGNOSTIC_COLUMNS = (
+        ('source', 'Kaynak', 110), ('circuit', 'Devre', 80), ('timeout', 'Zaman aşımı s', 85),
+        ('calls', 'Çağrı', 55), ('errors', 'Hata', 50), ('skipped', 'Atlanan', 60),
+        ('empty', 'Boş', 50), ('cache', 'Önbellek', 65), ('mean', 'Ort. ms', 70),
+        ('p95', 'p95 ms', 70), ('max', 'Maks ms', 70), ('parse', 'Ayrıştırma ms', 90),
+        ('kb', 'KB', 70), ('status', 'Durum', 90), ('histogram', 'Gecikme dağılımı', 170),
+        ('error', 'Son hata', 250)
+    )
+    
     def __init__(self, root):
         self.root = root
         self.db = DatabaseManager()
-        self.search_engine = SearchEngine()
-        self.summary_engine = SummaryEngine()
+        self.search_engine = SearchEngine(cache=SearchCache())
+        self.summary_engine = SummaryEngine(db=self.db)
         
         # GUI teması
         if THEME_AVAILABLE:
+            import ttkbootstrap as tb
             self.style = tb.Style(theme='flatly')
             self.root = self.style.master
         
@@ -555,10 +2606,30 @@ class AcademicSearcherPro:
         
         # Değişkenler
         self.search_history = []
-        self.current_results = []
+        self.current_results = []  # Filtrelenmemiş, tekilleştirilmiş ana küme
+        self._result_sort_keys = []  # Görünen satırların anahtarları (artan)
+        self._visible_keys = {}
+        self.sort_indexes = {}
+        self._results_view_job = None
+        self.deduplicator = ResultDeduplicator()
+        self.result_queue = queue.Queue()
+        self.search_id = 0
+        self.notes_cursor_key = None
+        self.notes_search = None  # Not araması sürerken (sorgu, sonraki sayfanın offset'i)
+        self.batch_summarizer = None
+        self.summary_job_id = 0
+        self.summary_job_running = False
+        self.summary_cancel = None  # Çalışan işin iptal olayı
+        # Tek kalıcı işçi: iptal edilen iş çıkana kadar yenisi sırada bekler, CPU'da üst üste binmez.
+        # Daemon thread; pencere kapanınca yarım kalan iş çıkışı bekletmez.
+        self.summary_jobs = queue.Queue()
+        threading.Thread(target=self._summary_worker, name='summary', daemon=True).start()
         
         self.setup_gui()
         self.load_notes()
+        
+        # Pencere çizildikten sonra özetleme kütüphanelerini arka planda hazırla
+        self.root.after(self.SUMMARY_WARMUP_DELAY_MS, self.summary_engine.warm_up)
     
     def setup_gui(self):
         """GUI'yi kur"""
@@ -616,26 +2687,11 @@ class AcademicSearcherPro:
         sources_frame = ttk.LabelFrame(self.search_frame, text="🌍 Akademik Kaynaklar")
         sources_frame.pack(fill='x', padx=10, pady=8)
         
-        # Kaynak değişkenleri
-        self.sources = {
-            'DOAJ': tk.BooleanVar(value=True),
-            'ArXiv': tk.BooleanVar(value=True),
-            'Crossref': tk.BooleanVar(value=True),
-            'PubMed': tk.BooleanVar(value=False),
-            'IEEE': tk.BooleanVar(value=False),
-            'MIT': tk.BooleanVar(value=False),
-            'DergiPark': tk.BooleanVar(value=False),
-            'TÜBİTAK': tk.BooleanVar(value=False),
-            'ODTÜ': tk.BooleanVar(value=False),
-            'İTÜ': tk.BooleanVar(value=False),
-            'Boğaziçi': tk.BooleanVar(value=False),
-            'Ankara Üniv.': tk.BooleanVar(value=False),
-            # YENİ KAYNAKLAR
-            'ScienceDirect': tk.BooleanVar(value=False),
-            'Springer': tk.BooleanVar(value=False),
-            'YÖK Tez': tk.BooleanVar(value=False),
-            'Milli Kütüphane': tk.BooleanVar(value=False)
-        }
+        # Kaynak değişkenleri (kayıt sırasıyla; eklenti kaynaklar da listelenir)
+        self.sources = {plugin.name: tk.BooleanVar(value=plugin.enabled)
+                        for plugin in self.search_engine.registry}
+        
+        self.source_checkbuttons = {}
         
         # Kaynakları 3 sütuna yerleştir
         sources_list = list(self.sources.keys())
@@ -660,7 +2716,9 @@ class AcademicSearcherPro:
                 frame = center_frame
             else:
                 frame = right_frame
-            ttk.Checkbutton(frame, text=source, variable=self.sources[source]).pack(anchor='w')
+            self.source_checkbuttons[source] = ttk.Checkbutton(frame, text=source,
+                                                               variable=self.sources[source])
+            self.source_checkbuttons[source].pack(anchor='w')
         
         # Hızlı seçim butonları
         quick_frame = ttk.Frame(sources_frame)
@@ -694,6 +2752,10 @@ class AcademicSearcherPro:
         ttk.Combobox(filter_frame, textvariable=self.sort_order, 
                     values=['desc', 'asc'], width=8).pack(side='left', padx=2)
         
+        # Filtre/sıralama değişince sonuçlar bellekten yeniden dizilir (yeni arama yok)
+        for var in (self.year_from, self.year_to, self.sort_by, self.sort_order):
+            var.trace_add('write', self.schedule_results_view)
+        
         # Sonuç sayısı
         ttk.Label(filter_frame, text='Sonuç:').pack(side='left', padx=(20,5))
         self.max_results = tk.StringVar(value='50')
@@ -724,7 +2786,7 @@ class AcademicSearcherPro:
         
         # Scrollbar
         scrollbar = ttk.Scrollbar(table_frame, orient='vertical', command=self.results_tree.yview)
-        self.results_tree.configure(yscrollcommand=scrollbar.set)
+        self.results_loader = LazyTreeLoader(self.results_tree, self._result_row_values, scrollbar)
         
         self.results_tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
@@ -752,6 +2814,8 @@ class AcademicSearcherPro:
         
         self.results_count = tk.StringVar(value="0 sonuç")
         ttk.Label(status_frame, textvariable=self.results_count).pack(side='right')
+        ttk.Button(status_frame, text='📊 Tanılama',
+                   command=self.show_diagnostics).pack(side='right', padx=5)
     
     def setup_notes_tab(self):
         """Notlar sekmesi"""
@@ -776,22 +2840,30 @@ class AcademicSearcherPro:
         list_frame = ttk.Frame(self.notes_frame)
         list_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        columns = ('id', 'title', 'source', 'authors', 'date')
-        self.notes_tree = ttk.Treeview(list_frame, columns=columns, show='headings')
+        columns = self.NOTE_COLUMNS + ('snippet',)
+        self.notes_tree = ttk.Treeview(list_frame, columns=columns, show='headings',
+                                       displaycolumns=self.NOTE_COLUMNS)
         
         self.notes_tree.heading('id', text='ID')
         self.notes_tree.heading('title', text='Başlık')
         self.notes_tree.heading('source', text='Kaynak')
         self.notes_tree.heading('authors', text='Yazarlar')
         self.notes_tree.heading('date', text='Tarih')
+        self.notes_tree.heading('snippet', text='Eşleşme')
         
         self.notes_tree.column('id', width=50)
         self.notes_tree.column('title', width=250)
         self.notes_tree.column('source', width=200)
         self.notes_tree.column('authors', width=150)
         self.notes_tree.column('date', width=120)
+        self.notes_tree.column('snippet', width=300)
         
-        self.notes_tree.pack(fill='both', expand=True)
+        notes_scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=self.notes_tree.yview)
+        self.notes_loader = LazyTreeLoader(self.notes_tree, self._note_row_values, notes_scrollbar,
+                                           on_end_reached=self.load_more_notes)
+        
+        self.notes_tree.pack(side='left', fill='both', expand=True)
+        notes_scrollbar.pack(side='right', fill='y')
         self.notes_tree.bind('<Double-1>', self.open_note_editor)
         
         # Not işlem butonları
@@ -803,6 +2875,17 @@ class AcademicSearcherPro:
         ttk.Button(button_frame, text='🗑️ Sil', command=self.delete_note).pack(side='left', padx=2)
         ttk.Button(button_frame, text='📋 Kaynağı Aç', command=self.open_note_source).pack(side='left', padx=2)
         ttk.Button(button_frame, text='📄 Özete Aktar', command=self.send_note_to_summary).pack(side='left', padx=2)
+        ttk.Button(button_frame, text='📚 Toplu Özet', command=self.start_batch_summary).pack(side='left', padx=2)
+        
+        self.load_more_notes_button = ttk.Button(button_frame, text='⬇️ Daha Fazla',
+                                                 command=self.load_more_notes, state='disabled')
+        self.load_more_notes_button.pack(side='right', padx=2)
+        
+        # Toplu özet ilerlemesi
+        self.batch_status_var = tk.StringVar(value="")
+        ttk.Label(button_frame, textvariable=self.batch_status_var).pack(side='right', padx=5)
+        self.batch_progress = ttk.Progressbar(button_frame, mode='determinate', length=150)
+        self.batch_progress.pack(side='right', padx=5)
     
     def setup_summary_tab(self):
         """Özet sekmesi"""
@@ -823,7 +2906,7 @@ class AcademicSearcherPro:
         ttk.Label(control_frame, text='Algoritma:').pack(side='left')
         self.summary_algo = tk.StringVar(value='lsa')
         ttk.Combobox(control_frame, textvariable=self.summary_algo,
-                    values=['lsa', 'textrank', 'key_sentences'], width=12).pack(side='left', padx=2)
+                    values=SummaryEngine.ALGORITHMS, width=12).pack(side='left', padx=2)
         
         ttk.Label(control_frame, text='Cümle:').pack(side='left', padx=(10,0))
         self.summary_length = tk.StringVar(value='5')
@@ -834,6 +2917,14 @@ class AcademicSearcherPro:
         ttk.Button(control_frame, text='🎯 Tezleri Çıkar', command=self.extract_theses).pack(side='left', padx=2)
         ttk.Button(control_frame, text='💾 Kaydet', command=self.save_summary).pack(side='left', padx=2)
         
+        self.cancel_summary_button = ttk.Button(control_frame, text='⏹ İptal',
+                                                command=self.cancel_summary_job, state='disabled')
+        self.cancel_summary_button.pack(side='left', padx=2)
+        self.summary_progress = ttk.Progressbar(control_frame, mode='indeterminate', length=120)
+        self.summary_progress.pack(side='left', padx=5)
+        self.summary_status_var = tk.StringVar(value="")
+        ttk.Label(control_frame, textvariable=self.summary_status_var).pack(side='left')
+        
         # Çıktı bölümü
         output_frame = ttk.LabelFrame(self.summary_frame, text="📄 Özet Çıktısı")
         output_frame.pack(fill='both', expand=True, padx=10, pady=5)
@@ -856,46 +2947,83 @@ class AcademicSearcherPro:
                 self.search_history.pop()
         
         # Temizle ve başlat
-        self.results_tree.delete(*self.results_tree.get_children())
+        self.search_id += 1
+        self.reset_results()
         self.status_var.set("Aranıyor...")
         self.progress.start()
         
-        thread = threading.Thread(target=self.perform_search, args=(query,))
+        thread = threading.Thread(target=self.perform_search, args=(query, self.search_id))
         thread.daemon = True
         thread.start()
+        self.root.after(self.RESULT_POLL_MS, self.drain_result_queue, self.search_id)
     
-    def perform_search(self, query):
-        """Arama yap (thread)"""
+    def reset_results(self):
+        """Sonuç kümesini, sıralama indekslerini ve tabloyu boşalt"""
+        self.results_loader.clear()
+        self.current_results = []
+        self._result_sort_keys = []
+        self._visible_keys = {}
+        self.sort_indexes = {name: SortIndex(key_func)
+                             for name, key_func in ResultProcessor.SORT_KEYS.items()}
+        self.deduplicator.reset()
+        self.results_count.set("0 sonuç")
+    
+    def perform_search(self, query, search_id):
+        """Arama yap (thread) - sonuçlar kaynak bazında kuyruğa aktarılır"""
         try:
             max_results = int(self.max_results.get())
             selected_sources = [source for source, var in self.sources.items() if var.get()]
             
             if not selected_sources:
                 self.root.after(0, self.show_no_sources_warning)
-                self.progress.stop()
                 return
             
-            all_results = []
             results_per_source = max(3, max_results // len(selected_sources))
             
-            for source in selected_sources:
-                self.root.after(0, lambda s=source: self.status_var.set(f"{s} aranıyor..."))
-                results = self.search_engine.search(source, query, results_per_source)
-                all_results.extend(results)
-                time.sleep(0.2)  # Rate limiting
-            
-            # Filtrele ve sırala
-            filtered = self.filter_results(all_results)
-            sorted_results = self.sort_results(filtered)
-            self.current_results = sorted_results
-            
-            # GUI'yi güncelle
-            self.root.after(0, self.update_results_display, sorted_results)
+            for source, results in self.search_engine.search_all(selected_sources, query, results_per_source):
+                self.result_queue.put(('results', search_id, source, results))
             
         except Exception as e:
-            self.root.after(0, lambda error=e: self.show_search_error(error))
+            self.result_queue.put(('error', search_id, None, e))
         finally:
-            self.root.after(0, self.progress.stop)
+            self.result_queue.put(('done', search_id, None, None))
+    
+    def drain_result_queue(self, search_id):
+        """Kuyruktaki sonuçları GUI thread'inde tabloya aktar"""
+        finished = False
+        try:
+            while True:
+                kind, msg_search_id, source, payload = self.result_queue.get_nowait()
+                if msg_search_id != self.search_id:
+                    continue  # Eski aramadan kalan mesaj
+                if kind == 'results':
+                    self.merge_results(payload)
+                    if self.update_source_marker(source):
+                        self.status_var.set(f"{source} tamamlandı")
+                elif kind == 'error':
+                    self.show_search_error(payload)
+                elif kind == 'done':
+                    finished = True
+        except queue.Empty:
+            pass
+        
+        if finished:
+            self.progress.stop()
+            self.status_var.set("Arama tamamlandı")
+        elif search_id == self.search_id:
+            self.root.after(self.RESULT_POLL_MS, self.drain_result_queue, search_id)
+    
+    def update_source_marker(self, source):
+        """Devresi açık kaynağı işaretle; kaynak sağlıklıysa True döndür"""
+        health = self.search_engine.source_health(source)
+        available = health.state == SourceHealth.CLOSED
+        checkbutton = self.source_checkbuttons.get(source)
+        if checkbutton is not None:
+            checkbutton.configure(text=source if available else f"{source} ⛔")
+        if not available:
+            self.status_var.set(f"⛔ {source} yanıt vermiyor, atlandı "
+                                f"({health.retry_in():.0f} sn sonra yeniden denenecek)")
+        return available
     
     def show_no_sources_warning(self):
         """Kaynak seçilmedi uyarısı"""
@@ -905,56 +3033,107 @@ class AcademicSearcherPro:
         """Arama hatası göster"""
         messagebox.showerror("Hata", f"Arama hatası: {str(error)}")
     
+    def result_processor(self):
+        """Arayüzdeki filtre ve sıralama ayarlarından işlemci oluştur"""
+        return ResultProcessor(self.year_from.get(), self.year_to.get(),
+                               self.sort_by.get(), self.sort_order.get())
+    
     def filter_results(self, results):
         """Sonuçları filtrele"""
-        year_from = self.year_from.get().strip()
-        year_to = self.year_to.get().strip()
-        
-        if not year_from and not year_to:
-            return results
-        
-        filtered = []
-        for item in results:
-            year = item.get('year', '')
-            # Year değerinin string olduğundan ve digit kontrolü yapmadan önce boş olmadığından emin ol
-            if year and isinstance(year, str) and year.isdigit():
-                year_int = int(year)
-                if year_from and year_from.isdigit() and year_int < int(year_from):
-                    continue
-                if year_to and year_to.isdigit() and year_int > int(year_to):
-                    continue
-            filtered.append(item)
-        
-        return filtered
-
+        return self.result_processor().filter(results)
+    
     def sort_results(self, results):
         """Sonuçları sırala"""
-        sort_by = self.sort_by.get()
-        reverse = self.sort_order.get() == 'desc'
-        
-        if sort_by == 'year':
-            return sorted(results, 
-                         key=lambda x: int(x.get('year', 0)) if x.get('year') and str(x.get('year')).isdigit() else 0, 
-                         reverse=reverse)
-        elif sort_by == 'title':
-            return sorted(results, key=lambda x: x.get('title', '').lower(), reverse=reverse)
-        elif sort_by == 'source':
-            return sorted(results, key=lambda x: x.get('source', ''), reverse=reverse)
-        return results
-    
-    def update_results_display(self, results):
-        """Sonuçları göster"""
-        for item in results:
-            self.results_tree.insert('', 'end', values=(
-                item.get('title', ''),
-                item.get('authors', ''),
-                item.get('year', ''),
-                item.get('source', ''),
-                item.get('link', '')
-            ))
-        
-        self.results_count.set(f"{len(results)} sonuç")
-        self.status_var.set("Arama tamamlandı")
+        return self.result_processor().sort(results)
+    
+    def merge_results(self, results):
+        """Yeni gelen sonuçları ana kümeye ekle; filtreden geçenleri sıralı görünüme yerleştir"""
+        processor = self.result_processor()
+        
+        new_records, merged_records = self.deduplicator.add(results)
+        self.current_results.extend(new_records)
+        for index in self.sort_indexes.values():
+            for record in new_records:
+                index.add(record)
+            for record in merged_records:
+                index.update(record)
+        
+        key_func = processor.sort_key_func()
+        for record in merged_records:
+            # Birleşme yılı/kaynağı değiştirebilir: gerekirse satırı yeniden konumlandır
+            visible = id(record) in self._visible_keys
+            matches = processor.matches(record)
+            if visible and matches and (key_func is None
+                                        or key_func(record) == self._visible_keys[id(record)]):
+                self.results_loader.refresh(record)
+                continue
+            self._hide_result(record)
+            if matches:
+                self._show_result(record, processor)
+        
+        for record in new_records:
+            if processor.matches(record):
+                self._show_result(record, processor)
+        
+        self._update_results_count()
+    
+    def _show_result(self, record, processor):
+        """Kaydı görünümde sıralamadaki yerine ekle"""
+        key_func = processor.sort_key_func()
+        if key_func is None:
+            key = None
+            index = len(self.results_loader.items)
+        else:
+            # Anahtarlar artan sırada tutulur; azalan görünümde indeks ters çevrilir
+            key = key_func(record)
+            position = bisect.bisect_right(self._result_sort_keys, key)
+            self._result_sort_keys.insert(position, key)
+            index = len(self._result_sort_keys) - 1 - position if processor.descending else position
+        self._visible_keys[id(record)] = key
+        self.results_loader.insert(index, record)
+    
+    def _hide_result(self, record):
+        """Kaydı görünümden çıkar (ana kümede kalır)"""
+        if id(record) not in self._visible_keys:
+            return
+        key = self._visible_keys.pop(id(record))
+        if key is not None:
+            del self._result_sort_keys[bisect.bisect_left(self._result_sort_keys, key)]
+        self.results_loader.remove(record)
+    
+    def schedule_results_view(self, *args):
+        """Filtre/sıralama değişikliğini kısa gecikmeyle uygula (yazarken her tuşta değil)"""
+        if self._results_view_job is not None:
+            self.root.after_cancel(self._results_view_job)
+        self._results_view_job = self.root.after(self.RESULT_VIEW_DELAY_MS, self.refresh_results_view)
+    
+    def refresh_results_view(self):
+        """Görünümü ana kümeden yeniden kur: ağ isteği yok, yalnızca değişen satırlar taşınır"""
+        self._results_view_job = None
+        processor = self.result_processor()
+        key_func = processor.sort_key_func()
+        
+        index = self.sort_indexes.get(processor.sort_by)
+        ordered = index.ordered(processor.descending) if index is not None else self.current_results
+        visible = processor.filter(ordered)
+        
+        keys = [key_func(record) for record in visible] if key_func is not None else []
+        self._visible_keys = {id(record): key for record, key in
+                              zip(visible, keys or [None] * len(visible))}
+        self._result_sort_keys = keys[::-1] if processor.descending else keys
+        
+        self.results_loader.reorder(visible)
+        self._update_results_count()
+    
+    def _update_results_count(self):
+        shown = len(self.results_loader.items)
+        total = len(self.current_results)
+        self.results_count.set(f"{shown} sonuç" if shown == total else f"{shown} / {total} sonuç")
+    
+    @staticmethod
+    def _result_row_values(item):
+        """Sonuç satırının tablo değerleri"""
+        return (item.title, item.authors, item.year or '', item.source, item.link)
     
     def open_selected_link(self, event=None):
         """Seçili linki aç"""
@@ -974,34 +3153,136 @@ class AcademicSearcherPro:
             self.results_tree.selection_set(item)
             self.context_menu.post(event.x_root, event.y_root)
     
+    # TANILAMA
+    def show_diagnostics(self):
+        """Kaynak bazlı gecikme/hata ölçümleri penceresi"""
+        window = tk.Toplevel(self.root)
+        window.title("Tanılama - Kaynak Ölçümleri")
+        window.geometry("1450x400")
+        
+        columns = [name for name, _, _ in self.DIAGNOSTIC_COLUMNS]
+        tree = ttk.Treeview(window, columns=columns, show='headings')
+        for name, heading, width in self.DIAGNOSTIC_COLUMNS:
+            tree.heading(name, text=heading)
+            tree.column(name, width=width, anchor='w' if name in ('source', 'histogram', 'error') else 'e')
+        tree.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        buckets = ' / '.join(f'{bound:g}' for bound in SearchMetrics.LATENCY_BUCKETS)
+        ttk.Label(window, text=f"Gecikme dağılımı kovaları (s): ≤ {buckets} / üstü").pack(anchor='w', padx=10)
+        
+        def refresh():
+            if not window.winfo_exists():
+                return
+            tree.delete(*tree.get_children())
+            for source, stats in self.search_engine.diagnostics()['sources'].items():
+                tree.insert('', 'end', values=self._diagnostic_row_values(source, stats))
+            window.after(self.DIAGNOSTICS_REFRESH_MS, refresh)
+        
+        def save_json():
+            path = filedialog.asksaveasfilename(
+                parent=window, defaultextension='.json', filetypes=[('JSON', '*.json')],
+                initialfile=f"search_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+            if path:
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(self.search_engine.diagnostics_json())
+                self.status_var.set(f"Ölçümler kaydedildi: {path}")
+        
+        def reset():
+            self.search_engine.metrics.reset()
+            tree.delete(*tree.get_children())
+        
+        button_frame = ttk.Frame(window)
+        button_frame.pack(fill='x', padx=10, pady=5)
+        ttk.Button(button_frame, text='💾 JSON Kaydet', command=save_json).pack(side='left', padx=2)
+        ttk.Button(button_frame, text='🔄 Sıfırla', command=reset).pack(side='left', padx=2)
+        ttk.Button(button_frame, text='Kapat', command=window.destroy).pack(side='right', padx=2)
+        
+        refresh()
+    
+    @staticmethod
+    def _diagnostic_row_values(source, stats):
+        """Ölçüm sözlüğünden tanılama satırı"""
+        def ms(seconds):
+            return f"{seconds * 1000:.0f}" if seconds is not None else '-'
+        
+        statuses = ', '.join(f"{status}×{count}" for status, count in stats['statuses'].items())
+        health = stats.get('health') or {}
+        circuit = {SourceHealth.CLOSED: 'kapalı', SourceHealth.HALF_OPEN: 'yarı açık',
+                   SourceHealth.OPEN: f"⛔ açık ({health.get('retry_in', 0):.0f} sn)"}.get(health.get('state'), '-')
+        timeout = f"{health['timeout']:.1f}" if health.get('timeout') is not None else '-'
+        return (
+            source, circuit, timeout, stats['calls'], stats['errors'], stats['skipped'],
+            stats['empty'], stats['cache_hits'],
+            ms(stats['latency_mean']), ms(stats['latency_p95']), ms(stats['latency_max']),
+            ms(stats['parse_time_mean']), f"{stats['bytes_received'] / 1024:.1f}",
+            statuses or '-', ' / '.join(str(count) for count in stats['latency_histogram'].values()),
+            stats['last_error'] or '-'
+        )
+    
     # NOT FONKSİYONLARI
     def load_notes(self):
-        """Notları yükle"""
-        notes = self.db.get_all_notes()
+        """Notların ilk sayfasını yükle"""
+        self.notes_search = None
+        notes, self.notes_cursor_key = self.db.get_notes_page(self.NOTES_PAGE_SIZE)
         self.display_notes(notes)
+        self._update_load_more_button()
     
-    def display_notes(self, notes):
+    def load_more_notes(self):
+        """Notların (veya arama sonuçlarının) sonraki sayfasını listeye ekle"""
+        if self.notes_search is not None:
+            self._load_notes_search_page(append=True)
+            return
+        if self.notes_cursor_key is None:
+            return
+        notes, self.notes_cursor_key = self.db.get_notes_page(self.NOTES_PAGE_SIZE, self.notes_cursor_key)
+        self.display_notes(notes, append=True)
+        self._update_load_more_button()
+    
+    def _update_load_more_button(self):
+        """Sonraki sayfa varsa 'Daha Fazla' butonunu etkinleştir"""
+        has_more = self.notes_cursor_key or self.notes_search is not None
+        self.load_more_notes_button.configure(state='normal' if has_more else 'disabled')
+    
+    def display_notes(self, notes, append=False):
         """Notları göster"""
-        self.notes_tree.delete(*self.notes_tree.get_children())
-        
-        for note in notes:
-            self.notes_tree.insert('', 'end', values=(
-                note['id'],
-                note['title'],
-                note['source_title'][:50] + '...' if len(note['source_title']) > 50 else note['source_title'],
-                note['source_authors'][:30] + '...' if len(note['source_authors']) > 30 else note['source_authors'],
-                note['modified_date'][:16]
-            ))
+        if append:
+            self.notes_loader.extend(notes)
+            return
+        
+        # Arama sonuçlarında eşleşen metin parçasını da göster
+        show_snippet = any(note.get('snippet') for note in notes)
+        self.notes_tree['displaycolumns'] = self.NOTE_COLUMNS + (('snippet',) if show_snippet else ())
+        self.notes_loader.set_items(notes)
+    
+    def _note_row_values(self, note):
+        """Not satırının tablo değerleri"""
+        return (
+            note['id'],
+            note['title'],
+            note['source_title'][:50] + '...' if len(note['source_title']) > 50 else note['source_title'],
+            note['source_authors'][:30] + '...' if len(note['source_authors']) > 30 else note['source_authors'],
+            note['modified_date'][:16],
+            note.get('snippet', '')
+        )
     
     def search_notes(self):
         """Notlarda arama"""
         query = self.note_search_var.get().strip()
         if query:
-            notes = self.db.search_notes(query)
-            self.display_notes(notes)
+            self.notes_cursor_key = None
+            self.notes_search = (query, 0)
+            self._load_notes_search_page()
         else:
             self.load_notes()
     
+    def _load_notes_search_page(self, append=False):
+        """Arama sonuçlarının sıradaki sayfası; sayfa dolmadıysa arama biter"""
+        query, offset = self.notes_search
+        notes = self.db.search_notes(query, limit=self.NOTES_PAGE_SIZE, offset=offset)
+        self.notes_search = (query, offset + len(notes)) if len(notes) == self.NOTES_PAGE_SIZE else None
+        self.display_notes(notes, append=append)
+        self._update_load_more_button()
+    
     def create_note(self):
         """Yeni not oluştur"""
         self.open_note_editor()
@@ -1015,8 +3296,7 @@ class AcademicSearcherPro:
         else:
             # Mevcut not
             note_id = self.notes_tree.item(selection[0])['values'][0]
-            notes = self.db.get_all_notes()
-            note_data = next((n for n in notes if n['id'] == note_id), {})
+            note_data = self.db.get_note(note_id) or {}
         
         self.show_note_editor(note_data)
     
@@ -1056,6 +3336,14 @@ class AcademicSearcherPro:
         content_text.pack(fill='both', expand=True, padx=10, pady=5)
         content_text.insert('1.0', note_data.get('content', ''))
         
+        # Toplu özetten gelen özet (salt okunur)
+        if note_data.get('summary'):
+            ttk.Label(editor, text="Otomatik Özet:").pack(anchor='w', padx=10)
+            summary_text = scrolledtext.ScrolledText(editor, wrap=tk.WORD, height=5)
+            summary_text.pack(fill='x', padx=10, pady=5)
+            summary_text.insert('1.0', note_data['summary'])
+            summary_text.configure(state='disabled')
+        
         def save_note():
             data = {field: entries[field].get() for field in entries}
             data['content'] = content_text.get('1.0', tk.END).strip()
@@ -1109,8 +3397,7 @@ class AcademicSearcherPro:
             return
         
         note_id = self.notes_tree.item(selection[0])['values'][0]
-        notes = self.db.get_all_notes()
-        note = next((n for n in notes if n['id'] == note_id), None)
+        note = self.db.get_note(note_id)
         
         if note and note['source_url']:
             webbrowser.open(note['source_url'])
@@ -1159,8 +3446,7 @@ class AcademicSearcherPro:
             return
         
         note_id = self.notes_tree.item(selection[0])['values'][0]
-        notes = self.db.get_all_notes()
-        note = next((n for n in notes if n['id'] == note_id), None)
+        note = self.db.get_note(note_id)
         
         if note:
             self.summary_input.delete('1.0', tk.END)
@@ -1177,11 +3463,8 @@ class AcademicSearcherPro:
         algorithm = self.summary_algo.get()
         sentences = int(self.summary_length.get())
         
-        try:
-            summary = self.summary_engine.summarize(text, algorithm, sentences)
-            self.display_summary(summary, "ÖZET")
-        except Exception as e:
-            messagebox.showerror("Hata", f"Özetleme hatası: {str(e)}")
+        self.start_summary_job(lambda cancel: self.summary_engine.summarize(text, algorithm, sentences, cancel),
+                               "ÖZET", "Özetleme hatası")
     
     def extract_theses(self):
         """Tezleri çıkar"""
@@ -1190,11 +3473,126 @@ class AcademicSearcherPro:
             messagebox.showwarning("Uyarı", "Lütfen daha uzun metin girin")
             return
         
+        self.start_summary_job(lambda cancel: self.summary_engine.extract_theses(text, cancel),
+                               "TEMEL TEZLER", "Tez çıkarma hatası")
+    
+    def start_summary_job(self, work, title, error_label):
+        """Özet işini tek özet işçisinde çalıştır; sonuç root.after ile gösterilir
+        
+        work(cancel) çağrılır. Çalışan iş varsa önce iptal edilir. İptal ve zaman
+        aşımı cancel olayını kurar: iş bir sonraki aşama sınırında SummaryCancelled
+        ile çıkar ve yeni iş işçide onun ardından başlar.
+        """
+        self.cancel_summary_job(silent=True)
+        self.summary_job_id += 1
+        job_id = self.summary_job_id
+        cancel = threading.Event()
+        self.summary_cancel = cancel
+        started = time.monotonic()
+        
+        def run():
+            if cancel.is_set():
+                return  # Sırada beklerken iptal edildi
+            try:
+                result, error = work(cancel), None
+            except SummaryCancelled:
+                return
+            except Exception as e:
+                result, error = None, e
+            self.root.after(0, self.finish_summary_job, job_id, title, error_label, result, error)
+        
+        self.summary_job_running = True
+        self.summary_progress.start()
+        self.cancel_summary_button.configure(state='normal')
+        self.summary_status_var.set("İşleniyor...")
+        self.summary_jobs.put(run)
+        self.root.after(self.SUMMARY_TIMEOUT_MS, self.timeout_summary_job, job_id)
+        self.root.after(500, self.update_summary_status, job_id, started)
+    
+    def _summary_worker(self):
+        """Özet işlerini sırayla çalıştıran işçi thread"""
+        while True:
+            self.summary_jobs.get()()
+    
+    def update_summary_status(self, job_id, started):
+        """Çalışan işin geçen süresini göster"""
+        if job_id == self.summary_job_id and self.summary_job_running:
+            self.summary_status_var.set(f"İşleniyor... {time.monotonic() - started:.0f} sn")
+            self.root.after(500, self.update_summary_status, job_id, started)
+    
+    def finish_summary_job(self, job_id, title, error_label, result, error):
+        """Özet işi bitti (GUI thread)"""
+        if job_id != self.summary_job_id or not self.summary_job_running:
+            return  # İptal edilmiş ya da zaman aşımına uğramış iş
+        self._stop_summary_job("")
+        if error is not None:
+            messagebox.showerror("Hata", f"{error_label}: {str(error)}")
+        else:
+            self.display_summary(result, title)
+    
+    def timeout_summary_job(self, job_id):
+        """Süresi dolan işi iptal et"""
+        if job_id == self.summary_job_id and self.summary_job_running:
+            self._stop_summary_job("Zaman aşımı")
+            messagebox.showwarning("Uyarı", "Özetleme zaman aşımına uğradı, daha kısa metin deneyin")
+    
+    def cancel_summary_job(self, silent=False):
+        """Çalışan özet işini iptal et"""
+        if self.summary_job_running:
+            self.summary_job_id += 1  # Gelecek sonucu geçersiz kıl
+            self._stop_summary_job("" if silent else "İptal edildi")
+    
+    def _stop_summary_job(self, status):
+        if self.summary_cancel is not None:
+            self.summary_cancel.set()
+            self.summary_cancel = None
+        self.summary_job_running = False
+        self.summary_progress.stop()
+        self.cancel_summary_button.configure(state='disabled')
+        self.summary_status_var.set(status)
+    
+    def start_batch_summary(self):
+        """Listelenen notları (arama sonucu ya da tümü) arka planda toplu özetle"""
+        if self.batch_summarizer is not None:
+            if messagebox.askyesno("Onay", "Toplu özet sürüyor. İptal edilsin mi?"):
+                self.batch_summarizer.cancel()
+                self.batch_status_var.set("İptal ediliyor...")
+            return
+        
+        query = self.note_search_var.get().strip()
+        notes = self.db.search_notes(query, limit=-1) if query else self.db.get_all_notes()
+        if not notes:
+            messagebox.showwarning("Uyarı", "Özetlenecek not yok")
+            return
+        if not messagebox.askyesno("Onay", f"{len(notes)} not özetlenecek. Devam edilsin mi?"):
+            return
+        
+        self.batch_summarizer = BatchSummarizer(self.db, self.summary_algo.get(),
+                                                int(self.summary_length.get()))
+        self.batch_status_var.set("Toplu özet başlıyor...")
+        thread = threading.Thread(target=self.run_batch_summary, args=(self.batch_summarizer, notes))
+        thread.daemon = True
+        thread.start()
+    
+    def run_batch_summary(self, summarizer, notes):
+        """Toplu özet (thread)"""
         try:
-            theses = self.summary_engine.extract_theses(text)
-            self.display_summary(theses, "TEMEL TEZLER")
+            succeeded, failed = summarizer.run(
+                notes, lambda done, total: self.root.after(0, self.update_batch_progress, done, total))
+            message = f"Toplu özet: {succeeded} tamamlandı, {failed} hata"
         except Exception as e:
-            messagebox.showerror("Hata", f"Tez çıkarma hatası: {str(e)}")
+            message = f"Toplu özet hatası: {str(e)}"
+        self.root.after(0, self.finish_batch_summary, message)
+    
+    def update_batch_progress(self, done, total):
+        """Toplu özet ilerlemesini göster"""
+        self.batch_progress.configure(maximum=max(total, 1), value=done)
+        self.batch_status_var.set(f"Özetleniyor: {done}/{total}")
+    
+    def finish_batch_summary(self, message):
+        """Toplu özet bitti"""
+        self.batch_summarizer = None
+        self.batch_status_var.set(message)
     
     def display_summary(self, content, title):
         """Özeti göster"""
@@ -1225,15 +3623,16 @@ class AcademicSearcherPro:
     
     def select_tr_sources(self):
         """Sadece Türkiye kaynaklarını seç"""
-        tr_sources = ['DergiPark', 'TÜBİTAK', 'ODTÜ', 'İTÜ', 'Boğaziçi', 'Ankara Üniv.', 'YÖK Tez', 'Milli Kütüphane']
-        for source, var in self.sources.items():
-            var.set(source in tr_sources)
+        self._select_sources_by_language('tr')
     
     def select_intl_sources(self):
         """Sadece uluslararası kaynakları seç"""
-        intl_sources = ['DOAJ', 'ArXiv', 'Crossref', 'PubMed', 'IEEE', 'MIT', 'ScienceDirect', 'Springer']
+        self._select_sources_by_language('intl')
+    
+    def _select_sources_by_language(self, language):
+        registry = self.search_engine.registry
         for source, var in self.sources.items():
-            var.set(source in intl_sources)
+            var.set(registry.get(source).language == language)
     
     def deselect_all_sources(self):
         """Tüm kaynakların seçimini kaldır"""
@@ -1241,11 +3640,151 @@ class AcademicSearcherPro:
             var.set(False)
 
 
-def main():
+def build_arg_parser():
+    """Komut satırı argümanları"""
+    parser = argparse.ArgumentParser(
+        description="Academic Searcher Pro - komut verilmezse arayüz açılır")
+    subparsers = parser.add_subparsers(dest='command')
+    
+    search_parser = subparsers.add_parser(
+        'search', help='Arayüz olmadan toplu arama (sorgular argüman, dosya veya stdin)')
+    search_parser.add_argument('queries', nargs='*', help='Arama sorguları')
+    search_parser.add_argument('--input', '-i', help="Her satırda bir sorgu içeren dosya ('-' = stdin)")
+    search_parser.add_argument('--sources', default='DOAJ,ArXiv,Crossref',
+                               help='Virgülle ayrılmış kaynaklar (varsayılan: DOAJ,ArXiv,Crossref)')
+    search_parser.add_argument('--max', type=int, default=50, dest='max_results',
+                               help='Sorgu başına toplam sonuç (kaynaklara bölünür)')
+    search_parser.add_argument('--year-from', default='', help='Başlangıç yılı')
+    search_parser.add_argument('--year-to', default='', help='Bitiş yılı')
+    search_parser.add_argument('--sort', default='year', choices=['year', 'title', 'source'])
+    search_parser.add_argument('--order', default='desc', choices=['desc', 'asc'])
+    search_parser.add_argument('--workers', type=int, default=4, help='Eşzamanlı sorgu sayısı')
+    search_parser.add_argument('--no-cache', action='store_true', help='Sonuç önbelleğini kullanma')
+    search_parser.add_argument('--json', action='store_true', help='JSON Lines çıktı')
+    search_parser.add_argument('--metrics', metavar='DOSYA',
+                               help="Kaynak bazlı ölçümleri JSON olarak yaz ('-' = stderr)")
+    
+    summarize_parser = subparsers.add_parser(
+        'summarize', help='Notları CPU çekirdeklerine dağıtarak toplu özetle')
+    summarize_parser.add_argument('--query', '-q', default='',
+                                  help='Yalnızca bu not aramasının sonuçlarını özetle')
+    summarize_parser.add_argument('--all', action='store_true', dest='resummarize',
+                                  help='Özeti olan notları da yeniden özetle')
+    summarize_parser.add_argument('--algorithm', default='lsa', choices=SummaryEngine.ALGORITHMS)
+    summarize_parser.add_argument('--sentences', type=int, default=5, help='Özet cümle sayısı')
+    summarize_parser.add_argument('--workers', type=int, default=None, help='Süreç sayısı (varsayılan: CPU sayısı)')
+    summarize_parser.add_argument('--db', default='academic_notes.db', help='Not veritabanı')
+    return parser
+
+
+def read_queries(args):
+    """Sorguları argümanlardan, dosyadan veya stdin'den oku"""
+    if args.queries:
+        lines = args.queries
+    elif args.input and args.input != '-':
+        with open(args.input, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    else:
+        lines = sys.stdin.read().splitlines()
+    return [line.strip() for line in lines if line.strip()]
+
+
+def run_search_command(args):
+    """Arayüzsüz toplu arama: sorgular eşzamanlı çalışır, sonuçlar tamamlandıkça yazılır"""
+    sources = [s.strip() for s in args.sources.split(',') if s.strip()]
+    registry = default_registry()
+    unknown = [s for s in sources if s not in registry]
+    if unknown or not sources:
+        print(f"Bilinmeyen kaynak: {', '.join(unknown) or '-'} "
+              f"(geçerli: {', '.join(registry.names())})", file=sys.stderr)
+        return 2
+    
+    queries = read_queries(args)
+    if not queries:
+        print("Arama sorgusu verilmedi", file=sys.stderr)
+        return 2
+    
+    engine = SearchEngine(cache=None if args.no_cache else SearchCache())
+    processor = ResultProcessor(args.year_from, args.year_to, args.sort, args.order)
+    results_per_source = max(3, args.max_results // len(sources))
+    
+    def run_query(query):
+        results = []
+        for _, source_results in engine.search_all(sources, query, results_per_source):
+            results.extend(source_results)
+        return processor.process(results)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+            futures = {executor.submit(run_query, query): query for query in queries}
+            for future in as_completed(futures):
+                query = futures[future]
+                for item in future.result():
+                    if args.json:
+                        print(json.dumps(dict(item.to_dict(), query=query), ensure_ascii=False))
+                    else:
+                        print('\t'.join([query, str(item.year or ''), item.source,
+                                         item.title, item.link]))
+                sys.stdout.flush()
+    finally:
+        engine.close()
+        for source in sources:
+            if not engine.is_available(source):
+                print(f"Uyarı: {source} yanıt vermediği için atlandı", file=sys.stderr)
+        if args.metrics == '-':
+            print(engine.diagnostics_json(), file=sys.stderr)
+        elif args.metrics:
+            with open(args.metrics, 'w', encoding='utf-8') as f:
+                f.write(engine.diagnostics_json())
+    return 0
+
+
+def run_summarize_command(args):
+    """Arayüzsüz toplu özet: ilerleme stderr'e yazılır"""
+    db = DatabaseManager(args.db)
+    try:
+        if args.query:
+            notes = db.search_notes(args.query, limit=-1)
+            if not args.resummarize:
+                notes = [note for note in notes if note['summary'] is None]
+        else:
+            notes = db.get_all_notes() if args.resummarize else db.get_notes_without_summary()
+        
+        def report(done, total):
+            print(f"\r{done}/{total} not özetlendi", end='', file=sys.stderr, flush=True)
+        
+        summarizer = BatchSummarizer(db, args.algorithm, args.sentences, args.workers)
+        try:
+            succeeded, failed = summarizer.run(notes, report)
+        except KeyboardInterrupt:
+            summarizer.cancel()
+            print("\nİptal edildi", file=sys.stderr)
+            return 130
+        print(f"\n{succeeded} tamamlandı, {failed} hata", file=sys.stderr)
+        return 1 if failed else 0
+    finally:
+        db.close()
+
+
+def main(argv=None):
     """Ana fonksiyon"""
+    args = build_arg_parser().parse_args(argv)
+    if args.command == 'search':
+        return run_search_command(args)
+    if args.command == 'summarize':
+        return run_summarize_command(args)
+    
+    if not GUI_AVAILABLE:
+        print("Tkinter bulunamadı; arayüzsüz kullanım için: academic_searcher.py search --help",
+              file=sys.stderr)
+        return 1
+    
     root = tk.Tk()
     app = AcademicSearcherPro(root)
     root.mainloop()
+    app.search_engine.close()
+    app.db.close()
+    return 0
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
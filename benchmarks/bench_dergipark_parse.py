@@ -0,0 +1,92 @@
+"""
+DergiPark ayrıştırma ölçümü - sentetik arama sayfalarında sayfa başına süre
+
+benchmarks/fixtures altındaki dergipark_search_*.html sayfaları
+SearchEngine._parse_dergipark_page ile ayrıştırılır. Sayfalar canlı siteden
+kaydedilmedi: sonuç kartları SearchEngine.DERGIPARK_* sınıf varsayımına göre,
+çevresi gerçek bir sayfanın boyutuna yakın olacak şekilde üretildi. Ölçüm
+ayrıştırıcının maliyetini izler; sitenin gerçek işaretlemesini doğrulamaz. bs4 kuruluysa eski
+yöntemin (tüm sayfadan BeautifulSoup 'html.parser' ağacı kurmak) maliyeti de
+karşılaştırma için gösterilir. Ayrıştırılan kayıt sayısı beklenenden azsa
+veya medyan süre eşiği aşarsa çıkış kodu 1 olur.
+
+Kullanım:
+    python benchmarks/bench_dergipark_parse.py [--runs 50] [--max-page-ms 15]
+"""
+
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_PATTERN = os.path.join(REPO_ROOT, 'benchmarks', 'fixtures', 'dergipark_search_*.html')
+
+# Fikstür sayfalarındaki sonuç kartı sayıları
+EXPECTED_RESULTS = {'dergipark_search_p1.html': 20, 'dergipark_search_p2.html': 7}
+
+sys.path.insert(0, REPO_ROOT)
+
+
+def measure(func, content, runs):
+    """func(content) için medyan süre (saniye) ve son çağrının sonucu"""
+    timings = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func(content)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=50)
+    parser.add_argument('--max-page-ms', type=float, default=15.0,
+                        help='Sayfa başına medyan ayrıştırma süresi için üst sınır (ms)')
+    args = parser.parse_args(argv)
+
+    from academic_searcher import SearchEngine
+    engine = SearchEngine()
+
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        BeautifulSoup = None
+
+    failures = []
+    paths = sorted(glob.glob(FIXTURE_PATTERN))
+    if not paths:
+        failures.append(f"fikstür bulunamadı: {FIXTURE_PATTERN}")
+
+    for path in paths:
+        name = os.path.basename(path)
+        with open(path, 'rb') as f:
+            content = f.read()
+
+        seconds, results = measure(engine._parse_dergipark_page, content, args.runs)
+        per_result = seconds / len(results) * 1e6 if results else 0.0
+        line = (f"{name}: {len(content) / 1024:.0f} KB, {len(results)} kayıt, "
+                f"medyan {seconds * 1000:.2f} ms ({per_result:.0f} µs/kayıt)")
+        if BeautifulSoup is not None:
+            baseline, _ = measure(lambda c: BeautifulSoup(c, 'html.parser'), content, max(1, args.runs // 5))
+            line += f" | bs4 html.parser ağacı: {baseline * 1000:.2f} ms (x{baseline / seconds:.1f})"
+        print(line)
+
+        expected = EXPECTED_RESULTS.get(name)
+        if expected is not None and len(results) != expected:
+            failures.append(f"{name}: {len(results)} kayıt, beklenen {expected}")
+        if any(not r.title or not r.link or not r.year for r in results):
+            failures.append(f"{name}: başlığı, linki veya yılı eksik kayıt var")
+        if seconds * 1000 > args.max_page_ms:
+            failures.append(f"{name}: ayrıştırma {seconds * 1000:.2f} ms > {args.max_page_ms} ms")
+
+    for failure in failures:
+        print(f"GERİLEME: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,539 @@
+"""
+Arama hattı ölçümü - sentetik yanıtlarla uçtan uca ve aşama bazlı maliyetler
+
+benchmarks/fixtures altındaki Crossref, DOAJ, ArXiv ve DergiPark yanıtları
+gerçek API çağrılarının kaydı değildir: her kaynağın yanıt biçiminde
+(alan adları, iç içe yapı, sayfa boyutu) üretilmiş sentetik kayıtlardır.
+Ayrı bir süreçte çalışan yerel HTTP sunucularından oynatılırlar (her kaynak
+ayrı port, yani ayrı host oturumu). Sunucu istenen sayfayı fikstür
+kayıtlarını döngüyle çoğaltarak üretir; sonraki turlarda başlık ve DOI'lere
+tur eki eklenir, kaynaklar arası ortak kayıt oranı korunur.
+
+Her ölçekte (varsayılan 10, 100, 1.000, 10.000 sonuç):
+  - uçtan uca: perform_search ile aynı kaynak başına limit, search_all ve
+    her kaynağın sonuçları için arayüzün kendi AcademicSearcherPro.merge_results
+    yolu (tekilleştirme, sıralama indeksleri, _show_result ile sıralı
+    yerleştirme, LazyTreeLoader satırları); ilk sonuç süresi, toplam süre ve
+    sonuç/saniye
+  - aşamalar: fetch (yanıt baytlarını indirme), parse, filter, dedup,
+    sort, render_prep (tekil kayıtlarla aynı merge_results yolu)
+
+Arayüz Tk olmadan sürülür: sonuç tablosu yerine StubTree kullanılır ve
+LazyTreeLoader'ın after() dilimleri her birleştirmeden sonra çalıştırılır
+(ana döngünün boşta yaptığı gibi). Tabloya yalnızca arayüzdeki kadar satır
+(görünür alan + önbellek) eklenir.
+
+Eşikler en büyük ölçekte sonuç başına mikro saniye olarak kontrol edilir;
+aşılırsa çıkış kodu 1 olur. Yavaş makinelerde --slack ile gevşetilebilir.
+Eşikler bu sentetik veriler üzerinde gerilemeyi yakalamak içindir; gerçek
+API'lerdeki ağ gecikmesi ve yanıt boyutları hakkında bir şey söylemez.
+
+Kullanım:
+    python benchmarks/bench_search_pipeline.py [--scales 10,100,1000,10000] [--runs 3]
+                                               [--slack 1.0] [--json sonuc.json]
+"""
+
+import argparse
+import copy
+import io
+import json
+import multiprocessing
+import os
+import re
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'fixtures')
+
+sys.path.insert(0, REPO_ROOT)
+
+QUERY = 'machine learning'
+SOURCES = ('DOAJ', 'ArXiv', 'Crossref', 'DergiPark')
+YEAR_FROM = '2015'  # Filtre aşaması kayıtların bir kısmını elesin
+
+# Kaynak -> (SearchEngine adres özniteliği, sunucudaki yol)
+ENDPOINTS = {
+    'DOAJ': ('DOAJ_API_URL', '/api/search/articles'),
+    'ArXiv': ('ARXIV_API_URL', '/api/query'),
+    'Crossref': ('CROSSREF_API_URL', '/works'),
+    'DergiPark': ('DERGIPARK_SEARCH_URL', '/tr/search')
+}
+
+STAGES = ('fetch', 'parse', 'filter', 'dedup', 'sort', 'render_prep')
+
+# En büyük ölçekte sonuç başına üst sınırlar (mikro saniye) ve ilk sonuç süresi (saniye);
+# referans makinedeki ölçümlerin yaklaşık 2.5-3 katı
+THRESHOLDS = {
+    'fetch': 120.0,
+    'parse': 300.0,
+    'filter': 2.0,
+    'dedup': 75.0,
+    'sort': 3.0,
+    'render_prep': 40.0,  # merge_results + LazyTreeLoader (arayüzün gerçek yolu)
+    'end_to_end': 600.0,
+    'first_result_seconds': 0.5
+}
+# İlk sonuç süresi arayüzdeki sonuç limitlerine karşılık gelen ölçeklerde kontrol edilir;
+# sonuçlar kaynak bazında geldiği için daha büyük ölçekte en hızlı kaynağın tüm sayfalarını bekler
+FIRST_RESULT_MAX_SCALE = 1000
+
+
+# --- Yerel sunucu (ayrı süreç) ---
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+class FixtureReplay:
+    """Sentetik fikstür yanıtlarından istenen sayfayı üretir"""
+
+    ARXIV_ENTRY_RE = re.compile(r'  <entry>.*?</entry>\n', re.DOTALL)
+    DERGIPARK_TITLE_RE = re.compile(r'(<h5 class="card-title">\s*<a href="[^"]+">)([^<]+)')
+    DERGIPARK_DOI_RE = re.compile(r'(href="https://doi\.org/[^"]+)"')
+
+    def __init__(self):
+        self.doaj = json.loads(load_fixture('doaj_page.json'))['results']
+        crossref = json.loads(load_fixture('crossref_page.json'))
+        self.crossref = crossref['message']['items']
+        self.crossref_total = crossref['message']['total-results']
+
+        feed = load_fixture('arxiv_page.xml')
+        self.arxiv_entries = self.ARXIV_ENTRY_RE.findall(feed)
+        first = feed.index('  <entry>')
+        self.arxiv_head = feed[:first]
+        self.arxiv_tail = feed[feed.rindex('</entry>\n') + len('</entry>\n'):]
+
+        self.dergipark = load_fixture('dergipark_search_p1.html')
+
+    @staticmethod
+    def _cycle(records, start, count, relabel):
+        """start'tan itibaren count kayıt; fikstür listesi bitince tur ekiyle baştan"""
+        size = len(records)
+        return [relabel(records[k % size], k // size) for k in range(start, start + count)]
+
+    @staticmethod
+    def _relabel_doaj(item, cycle):
+        if not cycle:
+            return item
+        item = copy.deepcopy(item)
+        bib = item['bibjson']
+        bib['title'] += f' ({cycle})'
+        for identifier in bib.get('identifier', []):
+            if identifier.get('type') == 'doi':
+                identifier['id'] += f'.{cycle}'
+        for link in bib.get('link', []):
+            link['url'] += f'.{cycle}'
+        return item
+
+    @staticmethod
+    def _relabel_crossref(item, cycle):
+        if not cycle:
+            return item
+        item = copy.deepcopy(item)
+        item['title'] = [item['title'][0] + f' ({cycle})']
+        item['DOI'] += f'.{cycle}'
+        item['URL'] += f'.{cycle}'
+        return item
+
+    @staticmethod
+    def _relabel_arxiv(entry, cycle):
+        if not cycle:
+            return entry
+        return (entry.replace('</title>', f' ({cycle})</title>', 1)
+                .replace('/abs/', f'/abs/c{cycle}.').replace('/pdf/', f'/pdf/c{cycle}.')
+                .replace('</arxiv:doi>', f'.{cycle}</arxiv:doi>'))
+
+    def render(self, path, params):
+        """(içerik türü, gövde) döndür"""
+        if path.startswith(ENDPOINTS['DOAJ'][1]):
+            page, size = int(params['page']), int(params['pageSize'])
+            results = self._cycle(self.doaj, (page - 1) * size, size, self._relabel_doaj)
+            body = {'total': 100000, 'page': page, 'pageSize': size, 'results': results}
+            return 'application/json', json.dumps(body, ensure_ascii=False).encode('utf-8')
+
+        if path.startswith(ENDPOINTS['Crossref'][1]):
+            cursor, rows = params['cursor'], int(params['rows'])
+            start = 0 if cursor == '*' else int(cursor)
+            items = self._cycle(self.crossref, start, rows, self._relabel_crossref)
+            message = {'next-cursor': str(start + rows), 'total-results': self.crossref_total,
+                       'items': items, 'items-per-page': rows}
+            body = {'status': 'ok', 'message-type': 'work-list', 'message': message}
+            return 'application/json', json.dumps(body, ensure_ascii=False).encode('utf-8')
+
+        if path.startswith(ENDPOINTS['ArXiv'][1]):
+            start, count = int(params['start']), int(params['max_results'])
+            entries = self._cycle(self.arxiv_entries, start, count, self._relabel_arxiv)
+            body = self.arxiv_head + ''.join(entries) + self.arxiv_tail
+            return 'application/atom+xml; charset=utf-8', body.encode('utf-8')
+
+        if path.startswith(ENDPOINTS['DergiPark'][1]):
+            cycle = int(params.get('page', 1)) - 1
+            page = self.dergipark
+            if cycle:
+                page = self.DERGIPARK_TITLE_RE.sub(lambda m: f'{m.group(1)}{m.group(2)} ({cycle})', page)
+                page = self.DERGIPARK_DOI_RE.sub(lambda m: f'{m.group(1)}.{cycle}"', page)
+            return 'text/html; charset=utf-8', page.encode('utf-8')
+
+        return None, None
+
+
+def serve_fixtures(ports, request_log, ready):
+    """Her kaynak için bir sunucu başlat (alt süreç hedefi)"""
+    replay = FixtureReplay()
+    rendered = {}  # Yol -> yanıt; tekrar istenen sayfada üretim maliyeti fetch'e girmesin
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # Keep-alive: istemci oturumu bağlantıyı yeniden kullanır
+        disable_nagle_algorithm = True  # Başlık ve gövde ayrı yazılıyor; gecikmeli ACK beklenmesin
+
+        def do_GET(self):
+            with lock:
+                response = rendered.get(self.path)
+            if response is None:
+                url = urlsplit(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                response = replay.render(url.path, params)
+                with lock:
+                    rendered[self.path] = response
+            content_type, body = response
+            if body is None:
+                self.send_error(404)
+                return
+            request_log.put((self.server.source, self.path))
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    servers = []
+    for source in SOURCES:
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        server.daemon_threads = True
+        server.source = source
+        servers.append(server)
+        ports[source] = server.server_address[1]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    ready.set()
+    threading.Event().wait()
+
+
+class FixtureServer:
+    """Fikstür yanıt sunucularını ayrı süreçte çalıştırır (GIL'i istemciyle paylaşmaz)"""
+
+    def __init__(self):
+        manager = multiprocessing.Manager()
+        self._manager = manager
+        self.ports = manager.dict()
+        self.request_log = manager.Queue()
+        ready = manager.Event()
+        self.process = multiprocessing.Process(target=serve_fixtures,
+                                               args=(self.ports, self.request_log, ready), daemon=True)
+        self.process.start()
+        if not ready.wait(30):
+            raise RuntimeError("fikstür sunucusu başlatılamadı")
+        self.base_urls = {source: f'http://127.0.0.1:{port}' for source, port in self.ports.items()}
+
+    def drain_log(self):
+        """O ana kadar sunulan (kaynak, yol) çiftleri"""
+        entries = []
+        while not self.request_log.empty():
+            entries.append(self.request_log.get())
+        return entries
+
+    def close(self):
+        self.process.terminate()
+        self.process.join()
+        self._manager.shutdown()
+
+
+# --- İstemci tarafı ölçümler ---
+
+class Value:
+    """tk.StringVar yerine get/set"""
+
+    def __init__(self, value=''):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class StubTree:
+    """ttk.Treeview'ın LazyTreeLoader'ın kullandığı kısmı; after() işleri kuyruğa alınır"""
+
+    def __init__(self):
+        self.values = {}
+        self.children = []
+        self.jobs = []
+
+    def configure(self, **options):
+        pass
+
+    def insert(self, parent, index, iid, values):
+        self.values[iid] = values
+        self.children.insert(index, iid)
+
+    def move(self, iid, parent, index):
+        if iid in self.children:
+            self.children.remove(iid)
+        self.children.insert(index, iid)
+
+    def detach(self, *iids):
+        for iid in iids:
+            self.children.remove(iid)
+
+    def delete(self, *iids):
+        for iid in iids:
+            if iid in self.children:
+                self.children.remove(iid)
+            del self.values[iid]
+
+    def item(self, iid, values):
+        self.values[iid] = values
+
+    def get_children(self):
+        return list(self.children)
+
+    def after(self, delay, callback):
+        self.jobs.append(callback)
+        return callback
+
+    def after_cancel(self, job):
+        self.jobs.remove(job)
+
+    def run_jobs(self):
+        """Bekleyen after() dilimlerini çalıştır"""
+        while self.jobs:
+            self.jobs.pop(0)()
+
+
+def build_results_view():
+    """Arayüzün sonuç görünümü: gerçek AcademicSearcherPro metotları, Tk'sız tablo"""
+    from academic_searcher import AcademicSearcherPro, LazyTreeLoader, ResultDeduplicator
+
+    view = AcademicSearcherPro.__new__(AcademicSearcherPro)
+    view.year_from, view.year_to = Value(YEAR_FROM), Value('')
+    view.sort_by, view.sort_order = Value('year'), Value('desc')
+    view.results_count = Value()
+    view.deduplicator = ResultDeduplicator()
+    view.results_tree = StubTree()
+    view.results_loader = LazyTreeLoader(view.results_tree, view._result_row_values)
+    view.reset_results()
+    return view
+
+
+def build_engine(base_urls):
+    """Yerel sunuculara yönlendirilmiş, hız sınırsız arama motoru"""
+    from academic_searcher import BUILTIN_SOURCES, SearchEngine, SourceRegistry
+
+    registry = SourceRegistry()
+    for plugin in BUILTIN_SOURCES:
+        plugin = copy.copy(plugin)
+        plugin.rate_limit = 0.0  # API kibarlık beklemeleri kod maliyetine karışmasın
+        registry.register(plugin)
+
+    engine = SearchEngine(retries=0, registry=registry)
+    for source, (attribute, path) in ENDPOINTS.items():
+        setattr(engine, attribute, base_urls[source] + path)
+    return engine
+
+
+def parsers(engine):
+    """Kaynak -> ham yanıt baytlarını kayıtlara çeviren fonksiyon"""
+    from academic_searcher import json_loads
+
+    return {
+        'DOAJ': lambda content: engine._parse_doaj_page(json_loads(content)),
+        'Crossref': lambda content: engine._parse_crossref_page(json_loads(content))[0],
+        'ArXiv': lambda content: list(engine._parse_arxiv_feed(io.BytesIO(content))),
+        'DergiPark': engine._parse_dergipark_page
+    }
+
+
+def results_per_source(scale):
+    """perform_search'teki kaynak başına limit"""
+    return max(3, scale // len(SOURCES))
+
+
+def run_end_to_end(engine, view, scale):
+    """Arayüzdeki arama akışı: search_all + kaynak kaynak merge_results"""
+    view.reset_results()
+    received = 0
+    first_result = None
+
+    start = time.perf_counter()
+    for _, results in engine.search_all(SOURCES, QUERY, results_per_source(scale)):
+        if results and first_result is None:
+            first_result = time.perf_counter() - start
+        received += len(results)
+        view.merge_results(results)
+        view.results_tree.run_jobs()
+    seconds = time.perf_counter() - start
+
+    return {
+        'seconds': seconds,
+        'first_result_seconds': first_result,
+        'results': received,
+        'unique': len(view.current_results),
+        'rows': len(view.results_loader.items),
+        'results_per_second': received / seconds if seconds else 0.0
+    }
+
+
+def run_stages(engine, view, base_urls, requests_made):
+    """Uçtan uca çalıştırmada istenen sayfalar üzerinde aşama süreleri (saniye)"""
+    from academic_searcher import ResultDeduplicator, ResultProcessor
+
+    timings = {}
+
+    start = time.perf_counter()
+    pages = [(source, engine._get(base_urls[source] + path).content) for source, path in requests_made]
+    timings['fetch'] = time.perf_counter() - start
+
+    parse = parsers(engine)
+    start = time.perf_counter()
+    results = []
+    for source, content in pages:
+        results.extend(parse[source](content))
+    timings['parse'] = time.perf_counter() - start
+
+    processor = ResultProcessor(YEAR_FROM, '', 'year', 'desc')
+
+    start = time.perf_counter()
+    filtered = processor.filter(results)
+    timings['filter'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    unique = ResultDeduplicator().deduplicate(filtered)
+    timings['dedup'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ordered = processor.sort(unique)
+    timings['sort'] = time.perf_counter() - start
+
+    view.reset_results()
+    start = time.perf_counter()
+    view.merge_results(unique)
+    view.results_tree.run_jobs()
+    timings['render_prep'] = time.perf_counter() - start
+
+    return timings, len(results), len(view.results_loader.items)
+
+
+def measure_scale(engine, server, scale, runs):
+    """Bir ölçek için medyan uçtan uca ve aşama ölçümleri"""
+    view = build_results_view()
+    end_to_end = []
+    stage_runs = []
+    result_count = 0
+    for _ in range(runs):
+        server.drain_log()
+        end_to_end.append(run_end_to_end(engine, view, scale))
+        requests_made = server.drain_log()
+        timings, result_count, _ = run_stages(engine, view, server.base_urls, requests_made)
+        server.drain_log()
+        stage_runs.append(timings)
+
+    summary = {key: statistics.median(run[key] for run in end_to_end)
+               for key in ('seconds', 'first_result_seconds', 'results_per_second')}
+    summary.update(results=end_to_end[-1]['results'], unique=end_to_end[-1]['unique'],
+                   rows=end_to_end[-1]['rows'])
+    stages = {stage: statistics.median(run[stage] for run in stage_runs) for stage in STAGES}
+    return {'scale': scale, 'end_to_end': summary, 'stages': stages, 'stage_results': result_count}
+
+
+def per_result_us(seconds, count):
+    return seconds / count * 1e6 if count else 0.0
+
+
+def print_report(report):
+    header = f"{'ölçek':>7} {'sonuç':>7} {'tekil':>7} {'ilk(ms)':>8} {'toplam(ms)':>10} {'sonuç/s':>9} | " + \
+             ' '.join(f'{stage:>12}' for stage in STAGES)
+    print(header)
+    print('-' * len(header))
+    for entry in report:
+        e2e = entry['end_to_end']
+        stages = ' '.join(f"{entry['stages'][stage] * 1000:>9.2f} ms" for stage in STAGES)
+        print(f"{entry['scale']:>7} {e2e['results']:>7} {e2e['unique']:>7} "
+              f"{(e2e['first_result_seconds'] or 0) * 1000:>8.1f} {e2e['seconds'] * 1000:>10.1f} "
+              f"{e2e['results_per_second']:>9.0f} | {stages}")
+    largest = report[-1]
+    per_result = ' '.join(f"{per_result_us(largest['stages'][stage], largest['stage_results']):>9.1f} µs"
+                          for stage in STAGES)
+    print(f"{'sonuç başına (en büyük ölçek)':>55} | {per_result}")
+
+
+def check_thresholds(report, slack):
+    """Eşik aşımlarını listele"""
+    failures = []
+    largest = report[-1]
+    count = largest['stage_results']
+    for stage in STAGES:
+        value = per_result_us(largest['stages'][stage], count)
+        limit = THRESHOLDS[stage] * slack
+        if value > limit:
+            failures.append(f"{stage}: {value:.1f} µs/sonuç > {limit:.1f} µs ({largest['scale']} ölçeği)")
+
+    e2e = largest['end_to_end']
+    value = per_result_us(e2e['seconds'], e2e['results'])
+    limit = THRESHOLDS['end_to_end'] * slack
+    if value > limit:
+        failures.append(f"uçtan uca: {value:.1f} µs/sonuç > {limit:.1f} µs ({largest['scale']} ölçeği)")
+
+    limit = THRESHOLDS['first_result_seconds'] * slack
+    for entry in report:
+        first = entry['end_to_end']['first_result_seconds']
+        if first is None:
+            failures.append(f"{entry['scale']} ölçeğinde hiç sonuç gelmedi")
+        elif first > limit and entry['scale'] <= FIRST_RESULT_MAX_SCALE:
+            failures.append(f"ilk sonuç {first:.3f}s > {limit:.3f}s ({entry['scale']} ölçeği)")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scales', default='10,100,1000,10000',
+                        help='Virgülle ayrılmış toplam sonuç sayıları')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--slack', type=float, default=1.0,
+                        help='Eşik çarpanı (yavaş makinelerde > 1)')
+    parser.add_argument('--json', metavar='DOSYA', help='Ölçümleri JSON olarak yaz')
+    args = parser.parse_args(argv)
+    scales = sorted(int(scale) for scale in args.scales.split(','))
+
+    server = FixtureServer()
+    engine = build_engine(server.base_urls)
+    try:
+        run_end_to_end(engine, build_results_view(), scales[0])  # Isınma: bağlantılar ve lxml yüklemesi ölçüme girmesin
+        report = [measure_scale(engine, server, scale, args.runs) for scale in scales]
+    finally:
+        engine.close()
+        server.close()
+
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'thresholds': THRESHOLDS, 'slack': args.slack, 'scales': report}, f, indent=2)
+
+    failures = check_thresholds(report, args.slack)
+    for failure in failures:
+        print(f"GERİLEME: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Açılış süresi ölçümü - academic_searcher modülünün soğuk yüklenme süresi
+
+Her ölçüm ayrı bir Python sürecinde yapılır. Modül yüklendikten sonra
+özetleme/ayrıştırma kütüphanelerinin (nltk, sumy, bs4, lxml, ttkbootstrap)
+yüklenmemiş olması da kontrol edilir. DISPLAY varsa pencerenin ilk çizim
+süresi de ölçülür. Eşik aşılırsa çıkış kodu 1 olur.
+
+Kullanım:
+    python benchmarks/bench_startup.py [--runs 5] [--max-import 0.5] [--max-window 1.5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Açılışta yüklenmemesi gereken ağır modüller
+LAZY_MODULES = ('nltk', 'sumy', 'bs4', 'lxml', 'ttkbootstrap')
+
+IMPORT_SNIPPET = '''
+import json, sys, time
+start = time.perf_counter()
+import academic_searcher
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+''' % (LAZY_MODULES,)
+
+WINDOW_SNIPPET = '''
+import json, time
+start = time.perf_counter()
+import academic_searcher
+import tkinter as tk
+root = tk.Tk()
+app = academic_searcher.AcademicSearcherPro(root)
+app.root.update()
+elapsed = time.perf_counter() - start
+app.root.destroy()
+print(json.dumps({"seconds": elapsed}))
+'''
+
+
+def run_snippet(snippet):
+    """Kod parçasını temiz bir süreçte çalıştır ve JSON çıktısını döndür"""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT, PYTHONDONTWRITEBYTECODE='1')
+    # Arayüz ölçümü veritabanı dosyalarını geçici dizine yazsın
+    with tempfile.TemporaryDirectory() as workdir:
+        output = subprocess.run([sys.executable, '-c', snippet], cwd=workdir, env=env,
+                                capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-import', type=float, default=0.5,
+                        help='Modül yükleme medyanı için üst sınır (saniye)')
+    parser.add_argument('--max-window', type=float, default=1.5,
+                        help='Pencere ilk çizim medyanı için üst sınır (saniye)')
+    args = parser.parse_args(argv)
+
+    failures = []
+
+    runs = [run_snippet(IMPORT_SNIPPET) for _ in range(args.runs)]
+    import_median = statistics.median(r['seconds'] for r in runs)
+    loaded = sorted(set(m for r in runs for m in r['loaded']))
+    print(f"import academic_searcher: medyan {import_median * 1000:.1f} ms ({args.runs} çalıştırma)")
+    if import_median > args.max_import:
+        failures.append(f"modül yükleme {import_median:.3f}s > {args.max_import}s")
+    if loaded:
+        failures.append(f"açılışta yüklenen ağır modüller: {', '.join(loaded)}")
+
+    if os.environ.get('DISPLAY') or sys.platform in ('win32', 'darwin'):
+        window_runs = [run_snippet(WINDOW_SNIPPET)['seconds'] for _ in range(args.runs)]
+        window_median = statistics.median(window_runs)
+        print(f"pencere ilk çizim: medyan {window_median * 1000:.1f} ms")
+        if window_median > args.max_window:
+            failures.append(f"pencere açılışı {window_median:.3f}s > {args.max_window}s")
+    else:
+        print("pencere ilk çizim: atlandı (DISPLAY yok)")
+
+    for failure in failures:
+        print(f"GERİLEME: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
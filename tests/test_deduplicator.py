@@ -0,0 +1,83 @@
+"""ResultDeduplicator eşleştirme kuralları"""
+
+import unittest
+
+from academic_searcher import ResultDeduplicator, SearchResult
+
+
+class ResultDeduplicatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.deduplicator = ResultDeduplicator()
+
+    def test_doi_match_merges_sources_and_links(self):
+        crossref = SearchResult('Deep Learning for Turkish NLP', 'A. Yılmaz', 2021, 'Crossref',
+                                'https://doi.org/10.1000/xyz', '10.1000/XYZ')
+        doaj = SearchResult('Deep learning for Turkish NLP (extended)', '', 2021, 'DOAJ',
+                            'https://doaj.org/article/1', 'https://doi.org/10.1000/xyz')
+
+        records = self.deduplicator.deduplicate([crossref, doaj])
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].sources, ('Crossref', 'DOAJ'))
+        self.assertEqual(records[0].links, ('https://doi.org/10.1000/xyz', 'https://doaj.org/article/1'))
+
+    def test_arxiv_match_by_id_and_arxiv_doi(self):
+        arxiv = SearchResult('Attention Is All You Need', 'A. Vaswani', 2017, 'ArXiv',
+                             'http://arxiv.org/pdf/1706.03762v5', arxiv_id='1706.03762')
+        crossref = SearchResult('Attention is all you need!', '', 2017, 'Crossref',
+                                'https://doi.org/10.48550/arXiv.1706.03762', '10.48550/arXiv.1706.03762')
+
+        records = self.deduplicator.deduplicate([arxiv, crossref])
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].doi, '10.48550/arXiv.1706.03762')
+
+    def test_fingerprint_match_without_identifiers(self):
+        first = SearchResult('Türkçe Metin Sınıflandırma', 'E. Kaya', 2020, 'DergiPark', 'https://a')
+        second = SearchResult('turkce metin siniflandirma.', '', 2020, 'DOAJ', 'https://b',
+                              '10.1000/abc')
+
+        records = self.deduplicator.deduplicate([first, second])
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].doi, '10.1000/abc')
+
+    def test_fingerprint_match_requires_same_year(self):
+        first = SearchResult('Türkçe Metin Sınıflandırma', '', 2020, 'DergiPark', 'https://a')
+        second = SearchResult('Türkçe Metin Sınıflandırma', '', 2021, 'DOAJ', 'https://b')
+
+        self.assertEqual(len(self.deduplicator.deduplicate([first, second])), 2)
+
+    def test_conflicting_doi_is_not_merged(self):
+        first = SearchResult('Editorial Board', '', 2020, 'Crossref', 'https://doi.org/10.1016/S0001-1',
+                             '10.1016/S0001-1')
+        second = SearchResult('Editorial Board', '', 2020, 'Crossref', 'https://doi.org/10.1016/S0002-2',
+                              '10.1016/S0002-2')
+
+        records = self.deduplicator.deduplicate([first, second])
+
+        self.assertEqual([r.doi for r in records], ['10.1016/S0001-1', '10.1016/S0002-2'])
+        self.assertEqual([r.links for r in records],
+                         [('https://doi.org/10.1016/S0001-1',), ('https://doi.org/10.1016/S0002-2',)])
+
+    def test_conflicting_arxiv_id_is_not_merged(self):
+        first = SearchResult('Book Reviews and Notes', '', 2019, 'ArXiv', 'https://a', arxiv_id='1901.00001')
+        second = SearchResult('Book Reviews and Notes', '', 2019, 'ArXiv', 'https://b', arxiv_id='1901.00002')
+
+        self.assertEqual(len(self.deduplicator.deduplicate([first, second])), 2)
+
+    def test_incremental_add_reports_new_and_merged(self):
+        first = SearchResult('Graph Neural Networks', '', 2022, 'ArXiv', 'https://a', '10.1000/gnn')
+        new, merged = self.deduplicator.add([first])
+        self.assertEqual((len(new), len(merged)), (1, 0))
+
+        duplicate = SearchResult('Graph neural networks', 'B. Demir', 2022, 'Crossref', 'https://b')
+        new, merged = self.deduplicator.add([duplicate])
+
+        self.assertEqual((len(new), len(merged)), (0, 1))
+        self.assertEqual(merged[0].authors, 'B. Demir')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""DergiPark arama sayfası ayrıştırma ve kart bulunamadığında geri dönüş"""
+
+import datetime
+import unittest
+from unittest import mock
+
+import requests
+
+from academic_searcher import SearchEngine, SearchMetrics
+
+CARD = '''
+<div class="card article-card">
+  <h5 class="card-title"><a href="/tr/pub/ornek/issue/1/{id}">Makale {id}: 2023 Verileriyle Analiz</a></h5>
+  <div class="article-authors"><a href="#">Ayşe Demir</a>, <a href="#">Can Öz</a></div>
+  <small class="article-meta">Örnek Dergi &middot; Cilt: 2019 Sayı: 4 &middot; ISSN: 2008-1234 {date}</small>
+  <a href="https://doi.org/10.1000/ORNEK.{id}">DOI</a>
+</div>
+'''
+
+
+def page(*cards):
+    return f'<html><body><div class="results">{"".join(cards)}</div></body></html>'.encode('utf-8')
+
+
+def response(content, url, status=200):
+    result = requests.Response()
+    result.status_code = status
+    result._content = content
+    result.url = url
+    result.elapsed = datetime.timedelta(milliseconds=5)
+    return result
+
+
+class DergiParkParseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = SearchEngine(metrics=SearchMetrics())
+
+    def tearDown(self):
+        self.engine.close()
+
+    def test_card_fields(self):
+        results = self.engine._parse_dergipark_page(
+            page(CARD.format(id=7, date='&middot; <span class="article-date">2021</span>')))
+
+        self.assertEqual(len(results), 1)
+        result = results[0]
+        self.assertEqual(result.title, 'Makale 7: 2023 Verileriyle Analiz')
+        self.assertEqual(result.authors, 'Ayşe Demir, Can Öz')
+        self.assertEqual(result.link, 'https://dergipark.org.tr/tr/pub/ornek/issue/1/7')
+        self.assertEqual(result.doi, '10.1000/ornek.7')
+
+    def test_year_comes_from_date_element_only(self):
+        dated, undated = self.engine._parse_dergipark_page(page(
+            CARD.format(id=1, date='<time class="article-date" datetime="2021-03-02">2 Mart</time>'),
+            CARD.format(id=2, date='')))
+
+        # Başlıktaki 2023, cilt 2019 ve ISSN 2008 yıl sayılmaz
+        self.assertEqual(dated.year, 2021)
+        self.assertEqual(undated.year, 0)
+
+    def test_page_without_cards_falls_back_to_search_link(self):
+        get = mock.Mock(side_effect=lambda url, **kwargs: response(page(), url))
+        with mock.patch.object(self.engine, '_get', get):
+            results = self.engine.search('DergiPark', 'derin öğrenme', 50)
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].title, 'DergiPark: derin öğrenme')
+        self.assertEqual(results[0].link,
+                         f'{SearchEngine.DERGIPARK_SEARCH_URL}?q=derin%20%C3%B6%C4%9Frenme&section=articles')
+
+        metrics = self.engine.metrics.snapshot()['sources']['DergiPark']
+        self.assertEqual(metrics['errors'], 1)
+        self.assertEqual(metrics['exceptions'], {'SourceParseError': 1})
+
+    def test_later_empty_page_ends_pagination_without_error(self):
+        cards = [CARD.format(id=i, date='<span class="article-date">2020</span>') for i in range(20)]
+        pages = {1: page(*cards), 2: page()}
+
+        def get(url, **kwargs):
+            return response(pages[int(url.rsplit('page=', 1)[1])], url)
+
+        with mock.patch.object(self.engine, '_get', side_effect=get):
+            results = self.engine.search('DergiPark', 'veri', 60)
+
+        self.assertEqual(len(results), 20)
+        self.assertEqual(self.engine.metrics.snapshot()['sources']['DergiPark']['errors'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""LazyTreeLoader: satır ekleme, yeniden sıralama ve ayrılmış satırların tazelenmesi"""
+
+import unittest
+
+from academic_searcher import LazyTreeLoader, SearchResult
+
+
+class FakeTree:
+    """ttk.Treeview'ın LazyTreeLoader'ın kullandığı kısmı (Tk gerektirmez)"""
+
+    def __init__(self):
+        self.values = {}
+        self.children = []
+        self.jobs = []
+
+    def configure(self, **options):
+        pass
+
+    def insert(self, parent, index, iid, values):
+        self.values[iid] = values
+        self.children.insert(index, iid)
+
+    def move(self, iid, parent, index):
+        if iid in self.children:
+            self.children.remove(iid)
+        self.children.insert(index, iid)
+
+    def detach(self, *iids):
+        for iid in iids:
+            self.children.remove(iid)
+
+    def delete(self, *iids):
+        for iid in iids:
+            if iid in self.children:
+                self.children.remove(iid)
+            del self.values[iid]
+
+    def item(self, iid, values):
+        self.values[iid] = values
+
+    def get_children(self):
+        return list(self.children)
+
+    def after(self, delay, callback):
+        self.jobs.append(callback)
+        return callback
+
+    def after_cancel(self, job):
+        self.jobs.remove(job)
+
+    def run_jobs(self):
+        while self.jobs:
+            self.jobs.pop(0)()
+
+    def rows(self):
+        return [self.values[iid] for iid in self.children]
+
+
+def row_values(record):
+    return (record.title, record.source, record.year)
+
+
+class LazyTreeLoaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = FakeTree()
+        self.loader = LazyTreeLoader(self.tree, row_values)
+        self.records = [SearchResult(f'Kayıt {i}', '', 2000 + i, 'ArXiv') for i in range(5)]
+
+    def test_set_items_materializes_in_chunks(self):
+        self.loader.set_items(self.records)
+        self.assertEqual(self.tree.rows(), [])
+
+        self.tree.run_jobs()
+
+        self.assertEqual([row[0] for row in self.tree.rows()], [r.title for r in self.records])
+
+    def test_reorder_reuses_rows(self):
+        self.loader.set_items(self.records)
+        self.tree.run_jobs()
+        iids = dict(zip((r.title for r in self.records), self.tree.children))
+
+        self.loader.reorder(list(reversed(self.records)))
+        self.tree.run_jobs()
+
+        self.assertEqual(self.tree.children, [iids[r.title] for r in reversed(self.records)])
+
+    def test_reattached_row_shows_values_changed_while_detached(self):
+        self.loader.set_items(self.records)
+        self.tree.run_jobs()
+        changed = self.records[2]
+
+        self.loader.reorder([r for r in self.records if r is not changed])  # Filtre dışı: detach
+        changed.source = 'ArXiv, Crossref'
+        changed.year = 1999
+        self.loader.reorder(sorted(self.records, key=lambda r: r.year))
+        self.tree.run_jobs()
+
+        self.assertEqual(self.tree.rows()[0], ('Kayıt 2', 'ArXiv, Crossref', 1999))
+
+    def test_insert_reattaches_with_current_values(self):
+        self.loader.set_items(self.records)
+        self.tree.run_jobs()
+        changed = self.records[0]
+        self.loader.reorder(self.records[1:])
+        changed.source = 'ArXiv, DOAJ'
+
+        self.loader.insert(0, changed)
+
+        self.assertEqual(self.tree.rows()[0], ('Kayıt 0', 'ArXiv, DOAJ', 2000))
+
+
+if __name__ == '__main__':
+    unittest.main()
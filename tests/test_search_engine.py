@@ -0,0 +1,154 @@
+"""SearchEngine.search: önbellek, ölçüm ve eklenti sözleşmesi (ağa çıkmadan)"""
+
+import os
+import socket
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from academic_searcher import (SearchCache, SearchEngine, SearchMetrics, SearchResult, SourcePlugin,
+                               SourceRegistry)
+
+
+def doaj_records(query, index, page_size):
+    return [SearchResult(f'Kayıt {index}-{i}', '', 2020, 'DOAJ', f'https://doaj.org/{index}/{i}')
+            for i in range(page_size)]
+
+
+class SearchEngineCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = SearchCache(os.path.join(self.directory.name, 'cache.db'))
+        self.engine = SearchEngine(cache=self.cache, metrics=SearchMetrics())
+
+    def tearDown(self):
+        self.engine.close()  # Önbelleği de kapatır
+        self.directory.cleanup()
+
+    def test_complete_result_is_cached(self):
+        with mock.patch.object(self.engine, '_fetch_doaj_page', side_effect=doaj_records):
+            results = self.engine.search('DOAJ', 'veri', 150)
+
+        self.assertEqual(len(results), 150)
+        self.assertEqual(len(self.cache.get('DOAJ', 'veri', 150)), 150)
+
+    def test_partial_result_after_error_is_not_cached(self):
+        def fetch(query, index, page_size):
+            if index == 1:
+                raise requests.ConnectionError('503 on page 2')
+            return doaj_records(query, index, page_size)
+
+        with mock.patch.object(self.engine, '_fetch_doaj_page', side_effect=fetch):
+            results = self.engine.search('DOAJ', 'veri', 150)
+
+        self.assertEqual(len(results), 100)  # Gelen sayfa yine de gösterilir
+        self.assertIsNone(self.cache.get('DOAJ', 'veri', 150))
+        self.assertIsNone(self.cache.get('DOAJ', 'veri', 150, allow_stale=True))
+
+
+class SourcePluginContractTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = SearchCache(os.path.join(self.directory.name, 'cache.db'))
+
+    def tearDown(self):
+        self.cache.close()
+        self.directory.cleanup()
+
+    def engine(self, *plugins, cache=True):
+        engine = SearchEngine(cache=self.cache if cache else None, metrics=SearchMetrics(),
+                              registry=SourceRegistry(plugins))
+        self.addCleanup(engine.close)
+        return engine
+
+    def test_dict_records_are_normalized(self):
+        def search(engine, query, max_results):
+            return [{'title': f'{query} üzerine', 'year': '2021', 'doi': '10.1000/x', 'link': 'https://x'}]
+
+        for cache in (True, False):
+            engine = self.engine(SourcePlugin('Sözlük', search=search, rate_limit=0), cache=cache)
+            results = engine.search('Sözlük', 'veri', 10)
+
+            self.assertIsInstance(results[0], SearchResult)
+            self.assertEqual((results[0].title, results[0].year, results[0].source),
+                             ('veri üzerine', 2021, 'Sözlük'))
+        self.assertEqual(len(self.cache.get('Sözlük', 'veri', 10)), 1)
+
+    def test_paginated_dict_records_are_normalized(self):
+        def fetch_page(engine, query, cursor, rows):
+            return [{'title': 'Sayfalı kayıt', 'source': 'Başka'}], None
+
+        engine = self.engine(SourcePlugin('Cursor', fetch_page=fetch_page,
+                                          pagination=SourcePlugin.CURSOR, rate_limit=0))
+        results = engine.search('Cursor', 'veri', 10)
+
+        self.assertEqual([(r.title, r.source) for r in results], [('Sayfalı kayıt', 'Başka')])
+
+    def test_other_record_types_are_reported(self):
+        engine = self.engine(SourcePlugin('Hatalı', search=lambda engine, query, n: ['metin'],
+                                          rate_limit=0))
+
+        self.assertEqual(engine.search('Hatalı', 'veri', 10), [])
+        metrics = engine.metrics.snapshot()['sources']['Hatalı']
+        self.assertEqual(metrics['exceptions'], {'TypeError': 1})
+        self.assertIn('SearchResult ya da dict olmalı', metrics['last_error'])
+
+
+class SearchMetricsTest(unittest.TestCase):
+
+    def engine(self, plugin, timeout=15):
+        engine = SearchEngine(timeout=timeout, metrics=SearchMetrics(), registry=SourceRegistry([plugin]))
+        self.addCleanup(engine.close)
+        return engine
+
+    def listening_socket(self):
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen()
+        self.addCleanup(server.close)
+        return server.getsockname()[1]
+
+    def test_read_timeout_is_not_reported_as_connection_error(self):
+        port = self.listening_socket()  # Bağlantıyı kabul eder, hiç yanıt vermez
+        plugin = SourcePlugin('Yavaş', search=lambda engine, query, n: engine._get(f'http://127.0.0.1:{port}/'),
+                              rate_limit=0)
+        engine = self.engine(plugin, timeout=0.3)
+
+        self.assertEqual(engine.search('Yavaş', 'veri', 10), [])
+        self.assertEqual(engine.metrics.snapshot()['sources']['Yavaş']['exceptions'], {'ReadTimeout': 1})
+
+    def test_refused_connection_is_reported_as_connection_error(self):
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        port = server.getsockname()[1]
+        server.close()  # Port kapalı: bağlantı reddedilir
+        plugin = SourcePlugin('Kapalı', search=lambda engine, query, n: engine._get(f'http://127.0.0.1:{port}/'),
+                              rate_limit=0)
+        engine = self.engine(plugin, timeout=2)
+
+        self.assertEqual(engine.search('Kapalı', 'veri', 10), [])
+        self.assertEqual(engine.metrics.snapshot()['sources']['Kapalı']['exceptions'], {'ConnectionError': 1})
+
+    def test_latency_excludes_rate_limiter_waits_on_paginated_sources(self):
+        def fetch_page(engine, query, index, page_size):
+            return [SearchResult(f'Kayıt {index}-{i}', source='Sayfalı') for i in range(page_size)]
+
+        plugin = SourcePlugin('Sayfalı', fetch_page=fetch_page, pagination=SourcePlugin.OFFSET,
+                              page_size=10, rate_limit=0.4)
+        engine = self.engine(plugin)
+
+        start = time.perf_counter()
+        self.assertEqual(len(engine.search('Sayfalı', 'veri', 30)), 30)
+        elapsed = time.perf_counter() - start
+
+        self.assertGreaterEqual(elapsed, 0.8)  # İkinci ve üçüncü sayfa sınırlayıcıyı bekler
+        self.assertLess(engine.metrics.snapshot()['sources']['Sayfalı']['latency_max'], 0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()